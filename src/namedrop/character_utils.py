@@ -5,222 +5,276 @@ Author: Rich Lewis
 GitHub: @RichLewis007
 """
 
+import re
 import unicodedata
+from functools import lru_cache
+from types import MappingProxyType
 
+# Any character outside printable ASCII (the standard range, 32-126)
+_NON_STANDARD_RE = re.compile(r"[^\x20-\x7e]")
 
-class CharacterUtils:
-    """Utilities for character detection and normalization"""
-
-    # Accented character mapping to unaccented equivalents
-    ACCENT_MAP = {
-        "à": "a",
-        "á": "a",
-        "â": "a",
-        "ã": "a",
-        "ä": "a",
-        "å": "a",
-        "è": "e",
-        "é": "e",
-        "ê": "e",
-        "ë": "e",
-        "ì": "i",
-        "í": "i",
-        "î": "i",
-        "ï": "i",
-        "ò": "o",
-        "ó": "o",
-        "ô": "o",
-        "õ": "o",
-        "ö": "o",
-        "ø": "o",
-        "ù": "u",
-        "ú": "u",
-        "û": "u",
-        "ü": "u",
-        "ý": "y",
-        "ÿ": "y",
-        "ñ": "n",
-        "ç": "c",
-        "À": "A",
-        "Á": "A",
-        "Â": "A",
-        "Ã": "A",
-        "Ä": "A",
-        "Å": "A",
-        "È": "E",
-        "É": "E",
-        "Ê": "E",
-        "Ë": "E",
-        "Ì": "I",
-        "Í": "I",
-        "Î": "I",
-        "Ï": "I",
-        "Ò": "O",
-        "Ó": "O",
-        "Ô": "O",
-        "Õ": "O",
-        "Ö": "O",
-        "Ø": "O",
-        "Ù": "U",
-        "Ú": "U",
-        "Û": "U",
-        "Ü": "U",
-        "Ý": "Y",
-        "Ÿ": "Y",
-        "Ñ": "N",
-        "Ç": "C",
+# Shared default for ignore_chars, so functions never need a None check
+_EMPTY = frozenset()
+
+# Letters with no Unicode decomposition, mapped to their usual ASCII spelling.
+# Every other accented letter is handled by NFD decomposition + mark removal.
+# Read-only, since the translation tables below are derived from it at import.
+LIGATURE_MAP = MappingProxyType(
+    {
         "æ": "ae",
-        "œ": "oe",
-        "ß": "ss",
         "Æ": "AE",
+        "œ": "oe",
         "Œ": "OE",
+        "ß": "ss",
         "ð": "d",
         "Ð": "D",
         "þ": "th",
         "Þ": "TH",
+        "ø": "o",
+        "Ø": "O",
         "ł": "l",
         "Ł": "L",
         "đ": "d",
         "Đ": "D",
-        "č": "c",
-        "Č": "C",
-        "ć": "c",
-        "Ć": "C",
-        "ř": "r",
-        "Ř": "R",
-        "ž": "z",
-        "Ž": "Z",
-        "š": "s",
-        "Š": "S",
-        "ť": "t",
-        "Ť": "T",
-        "ď": "d",
-        "Ď": "D",
-        "ň": "n",
-        "Ň": "N",
-        "ą": "a",
-        "Ą": "A",
-        "ę": "e",
-        "Ę": "E",
-        "ė": "e",
-        "Ė": "E",
-        "į": "i",
-        "Į": "I",
-        "ų": "u",
-        "Ų": "U",
-        "ū": "u",
-        "Ū": "U",
-        "ą": "a",
-        "Ą": "A",
-        "ć": "c",
-        "Ć": "C",
-        "ę": "e",
-        "Ę": "E",
-        "ł": "l",
-        "Ł": "L",
-        "ń": "n",
-        "Ń": "N",
-        "ó": "o",
-        "Ó": "O",
-        "ś": "s",
-        "Ś": "S",
-        "ź": "z",
-        "Ź": "Z",
-        "ż": "z",
-        "Ż": "Z",
-        "ğ": "g",
-        "Ğ": "G",
-        "ş": "s",
-        "Ş": "S",
         "ı": "i",
-        "İ": "I",
-        "ă": "a",
-        "Ă": "A",
-        "â": "a",
-        "Â": "A",
-        "î": "i",
-        "Î": "I",
-        "ș": "s",
-        "Ș": "S",
-        "ț": "t",
-        "Ț": "T",
     }
+)
+
+# Combining Diacritical Marks block (the accents left behind by NFD decomposition)
+COMBINING_MARKS = range(0x0300, 0x0370)
+
+# str.translate table for replace_accented_chars: ligatures replaced, accents deleted
+_ACCENT_TABLE = {
+    **str.maketrans(dict(LIGATURE_MAP)),
+    **dict.fromkeys(COMBINING_MARKS),
+}
+
+# First codepoint past Latin Extended-B, the end of the accent lookup table
+_ACCENT_LUT_END = "\u0250"
+
+
+def _build_accent_lut() -> list:
+    """
+    Build a list-based str.translate table covering U+0000..U+024F
+    Each entry is the character's accent-stripped form (or its own codepoint if
+    unchanged), so the whole range needs no dict hashing at all
+    """
+    lut = list(range(ord(_ACCENT_LUT_END)))
+    for codepoint in range(0x80, ord(_ACCENT_LUT_END)):
+        char = chr(codepoint)
+        # Same steps as _strip_accents with nothing ignored
+        decomposed = unicodedata.normalize("NFD", char)
+        replacement = unicodedata.normalize("NFC", decomposed.translate(_ACCENT_TABLE))
+        if replacement != char:
+            lut[codepoint] = replacement
+    return lut
+
+
+_ACCENT_LUT = _build_accent_lut()
+
+
+class _AutoFixTable(dict):
+    """
+    str.translate table used by auto_fix_name
+    Starts out holding the ligature replacements; every other character is kept if it is
+    standard ASCII or ignored, otherwise deleted. Those entries are filled in the first
+    time a character is seen, so the table never has to cover all of Unicode up front.
+    """
+
+    def __init__(self, ligature_table: dict, ignore_chars: frozenset):
+        super().__init__(ligature_table)
+        self.ignore_chars = ignore_chars
+
+    def __missing__(self, codepoint: int):
+        if 32 <= codepoint <= 126 or chr(codepoint) in self.ignore_chars:
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+@lru_cache(maxsize=32)
+def _build_autofix_table(ignore_chars: frozenset) -> _AutoFixTable:
+    """Build the auto-fix translation table for one set of ignored characters"""
+    ligature_table = {
+        ord(char): replacement
+        for char, replacement in LIGATURE_MAP.items()
+        if char not in ignore_chars
+    }
+    return _AutoFixTable(ligature_table, ignore_chars)
+
+
+def get_common_allowed_chars():
+    """Get string of common special characters allowed in file names across OSes"""
+    # Characters safe for Windows, macOS, Linux, and cloud services
+    # Includes: space, period, hyphen, underscore, plus some brackets and punctuation
+    # Note: Windows doesn't allow: < > : " | ? * \
+    # macOS doesn't allow: :
+    # Most cloud services are more restrictive
+    return " -_.()[]{}!@#$%^&+=,;'`"
+
+
+def is_standard_ascii(char: str, ignore_chars: frozenset = _EMPTY) -> bool:
+    """
+    Check if character is standard ASCII (printable ASCII 32-126)
+    Excluding characters in ignore_chars set
+    """
+    return char in ignore_chars or 32 <= ord(char) <= 126
 
-    def __init__(self):
-        pass
-
-    def get_common_allowed_chars(self):
-        """Get string of common special characters allowed in file names across OSes"""
-        # Characters safe for Windows, macOS, Linux, and cloud services
-        # Includes: space, period, hyphen, underscore, plus some brackets and punctuation
-        # Note: Windows doesn't allow: < > : " | ? * \
-        # macOS doesn't allow: :
-        # Most cloud services are more restrictive
-        return " -_.()[]{}!@#$%^&+=,;'`"
-
-    def is_standard_ascii(self, char: str, ignore_chars: set = None) -> bool:
-        """
-        Check if character is standard ASCII (printable ASCII 32-126)
-        Excluding characters in ignore_chars set
-        """
-        if ignore_chars and char in ignore_chars:
-            return True
-
-        # Standard ASCII printable range is 32-126
-        return 32 <= ord(char) <= 126
-
-    def find_non_standard_ascii(self, text: str, ignore_chars: set = None) -> set:
-        """
-        Find all non-standard ASCII characters in text
-        Returns set of characters that are not standard ASCII
-        """
-        bad_chars = set()
-        for char in text:
-            if not self.is_standard_ascii(char, ignore_chars):
-                bad_chars.add(char)
-        return bad_chars
-
-    def replace_accented_chars(self, text: str, ignore_chars: set = None) -> str:
-        """
-        Replace accented characters with unaccented equivalents
-        Only handles accented characters, leaves other non-ASCII alone if not in ignore_chars
-        """
-        result = []
-        for char in text:
-            if char in ignore_chars:
-                result.append(char)
-            elif char in self.ACCENT_MAP:
-                result.append(self.ACCENT_MAP[char])
-            elif self.is_standard_ascii(char, ignore_chars):
-                result.append(char)
-            else:
-                # Non-accented non-ASCII character - keep it
-                result.append(char)
-        return "".join(result)
-
-    def remove_bad_chars(self, text: str, ignore_chars: set = None) -> str:
-        """
-        Remove all non-standard ASCII characters
-        """
-        result = []
-        for char in text:
-            if self.is_standard_ascii(char, ignore_chars):
-                result.append(char)
-        return "".join(result)
-
-    def auto_fix_name(self, text: str, ignore_chars: set = None) -> str:
-        """
-        Auto-fix: replace accented chars with equivalents, remove other non-ASCII
-        """
-        # First replace accented characters
-        text = self.replace_accented_chars(text, ignore_chars)
-        # Then remove any remaining non-standard ASCII
-        text = self.remove_bad_chars(text, ignore_chars)
+
+def is_all_standard_ascii(text: str) -> bool:
+    """
+    Check if every character in text is standard ASCII (printable ASCII 32-126)
+    """
+    # str.isascii() reads a flag CPython keeps on the string object, so only
+    # ASCII text pays for the scan. Within ASCII, isprintable() is true for exactly
+    # 32-126, and checks that in one C loop with no hashing
+    return text.isascii() and text.isprintable()
+
+
+def find_non_standard_ascii(text: str, ignore_chars: frozenset = _EMPTY) -> set:
+    """
+    Find all non-standard ASCII characters in text
+    Returns set of characters that are not standard ASCII
+    """
+    if is_all_standard_ascii(text):
+        return set()
+    # The regex scanner skips over the (usually ASCII) bulk of the name in C and
+    # only hands back the offending characters
+    return set(_NON_STANDARD_RE.findall(text)).difference(ignore_chars)
+
+
+def _get_accent_table(ignore_chars: frozenset = _EMPTY) -> dict:
+    """
+    Get the accent translation table, leaving out any characters in ignore_chars
+    """
+    if not ignore_chars:
+        return _ACCENT_TABLE
+    ignored = {ord(char) for char in ignore_chars if len(char) == 1}
+    if ignored.isdisjoint(_ACCENT_TABLE):
+        return _ACCENT_TABLE
+    return {
+        codepoint: replacement
+        for codepoint, replacement in _ACCENT_TABLE.items()
+        if codepoint not in ignored
+    }
+
+
+def _decompose(text: str, ignore_chars: frozenset = _EMPTY) -> str:
+    """
+    NFD-decompose text so accents become separate combining marks
+    Ignored non-ASCII characters are left composed so they survive untouched
+    """
+    if ignore_chars:
+        kept = {char for char in ignore_chars if not char.isascii()}
+        if kept and not kept.isdisjoint(text):
+            return "".join(
+                char if char in kept else normalize_unicode(char) for char in text
+            )
+    return normalize_unicode(text)
+
+
+def replace_accented_chars(text: str, ignore_chars: frozenset = _EMPTY) -> str:
+    """
+    Replace accented characters with unaccented equivalents
+    Only handles accented characters, leaves other non-ASCII alone if not in ignore_chars
+    """
+    if text.isascii():
+        return text
+    # Latin-1 Supplement and Latin Extended-A/B: one direct-indexed lookup per
+    # character, no decomposition needed. The table is only valid when nothing in
+    # the text and no ligature or accent mark is ignored. Only single characters
+    # can be ignored, as in _get_accent_table.
+    if max(text) < _ACCENT_LUT_END and not any(
+        char in text or ord(char) in _ACCENT_TABLE
+        for char in ignore_chars
+        if len(char) == 1 and not char.isascii()
+    ):
+        return text.translate(_ACCENT_LUT)
+    return _strip_accents(text, ignore_chars)
+
+
+def _strip_accents(text: str, ignore_chars: frozenset = _EMPTY) -> str:
+    """
+    General accent replacement for any text, used outside the lookup table range
+    """
+    # Decompose, drop the accent marks, then recompose whatever non-ASCII remains
+    stripped = _decompose(text, ignore_chars).translate(_get_accent_table(ignore_chars))
+    return unicodedata.normalize("NFC", stripped)
+
+
+def remove_bad_chars(text: str, ignore_chars: frozenset = _EMPTY) -> str:
+    """
+    Remove all non-standard ASCII characters
+    """
+    bad_chars = find_non_standard_ascii(text, ignore_chars)
+    if not bad_chars:
         return text
+    return text.translate(dict.fromkeys(map(ord, bad_chars)))
+
+
+def _get_autofix_table(ignore_chars: frozenset = _EMPTY) -> _AutoFixTable:
+    """
+    Get the (cached) auto-fix translation table for the given ignore_chars
+    """
+    return _build_autofix_table(frozenset(ignore_chars))
+
+
+def auto_fix_name(text: str, ignore_chars: frozenset = _EMPTY) -> str:
+    """
+    Auto-fix: replace accented chars with equivalents, remove other non-ASCII
+    """
+    # Common case: printable ASCII, which the table keeps as is
+    if is_all_standard_ascii(text):
+        return text
+    # Single pass over the decomposed text: the table replaces ligatures and
+    # deletes accent marks along with any other non-ASCII
+    return _decompose(text, ignore_chars).translate(_get_autofix_table(ignore_chars))
+
+
+def auto_fix_names(names, ignore_chars: frozenset = _EMPTY) -> list:
+    """
+    Auto-fix a batch of names, same result as auto_fix_name on each one
+    The translation table is looked up once and clean names are passed through
+    """
+    table = _get_autofix_table(ignore_chars)
+    return [
+        (
+            name
+            if is_all_standard_ascii(name)
+            else _decompose(name, ignore_chars).translate(table)
+        )
+        for name in names
+    ]
+
+
+def normalize_unicode(text: str) -> str:
+    """
+    Normalize Unicode characters using NFD decomposition
+    Useful for some edge cases
+    """
+    # ASCII is already in every normalization form
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFD", text)
+
+
+class CharacterUtils:
+    """
+    Utilities for character detection and normalization
+    Kept for existing callers; every method is one of the module-level functions
+    """
+
+    LIGATURE_MAP = LIGATURE_MAP
+    COMBINING_MARKS = COMBINING_MARKS
 
-    def normalize_unicode(self, text: str) -> str:
-        """
-        Normalize Unicode characters using NFD decomposition
-        Useful for some edge cases
-        """
-        return unicodedata.normalize("NFD", text)
+    get_common_allowed_chars = staticmethod(get_common_allowed_chars)
+    is_standard_ascii = staticmethod(is_standard_ascii)
+    is_all_standard_ascii = staticmethod(is_all_standard_ascii)
+    find_non_standard_ascii = staticmethod(find_non_standard_ascii)
+    replace_accented_chars = staticmethod(replace_accented_chars)
+    remove_bad_chars = staticmethod(remove_bad_chars)
+    auto_fix_name = staticmethod(auto_fix_name)
+    auto_fix_names = staticmethod(auto_fix_names)
+    normalize_unicode = staticmethod(normalize_unicode)
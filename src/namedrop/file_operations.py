@@ -6,162 +6,338 @@ GitHub: @RichLewis007
 """
 
 import os
+import random
+import re
 import shutil
+import stat
+import sys
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Windows reserved device names, lowercased for case-insensitive lookups
+_WIN_RESERVED = frozenset(
+    {"con", "prn", "aux", "nul"}
+    | {f"com{i}" for i in range(1, 10)}
+    | {f"lpt{i}" for i in range(1, 10)}
+)
+
+# Invalid characters for Windows file names
+WINDOWS_INVALID_CHARS = frozenset('<>:"|?*\\')
+# Invalid characters for macOS
+MACOS_INVALID_CHARS = frozenset(":")
+# Invalid characters for Linux (most are allowed, but these are problematic)
+LINUX_INVALID_CHARS = frozenset("/\0")
+
+# Control characters (0x00-0x1F except tab, 0x7F), decoded from bytes in one C call
+CONTROL_CHARS = frozenset(
+    bytes(range(32)).replace(b"\t", b"").decode("latin-1") + "\x7f"
+)
+
+# Every character rejected by is_valid_filename, combined once
+_INVALID_UNION = (
+    WINDOWS_INVALID_CHARS | MACOS_INVALID_CHARS | LINUX_INVALID_CHARS | CONTROL_CHARS
+)
+
+# One pattern covering invalid characters, trailing period/space (invalid on Windows)
+# and Windows reserved names, so validation is a single regex search
+_INVALID_FILENAME_RE = re.compile(
+    "["
+    + re.escape("".join(sorted(_INVALID_UNION)))
+    + r"]|[. ]\Z|\A(?:"
+    + "|".join(sorted(_WIN_RESERVED))
+    + r")(?:\.|\Z)",
+    re.IGNORECASE,
+)
+
+# Retry backoff for safe_rename_with_retry: 10ms, 20ms, 40ms, ... capped at 0.5s
+_RETRY_BASE_DELAY = 0.01
+_RETRY_MAX_DELAY = 0.5
+
+
+class RenameResult(Enum):
+    """Outcome of rename_file; truthy only on success"""
+
+    OK = "ok"
+    # Worth retrying: the file is locked or in use
+    TRANSIENT = "transient"
+    # Retrying will not help: invalid name, missing source, target exists, etc.
+    FAILED = "failed"
+
+    def __bool__(self):
+        return self is RenameResult.OK
+
+
+# FICLONE ioctl request number from <linux/fs.h> (Btrfs, XFS, bcachefs reflinks)
+_FICLONE = 0x40049409
 
-class FileOperations:
-    """Safe file operations for renaming"""
 
-    # Invalid characters for Windows file names
-    WINDOWS_INVALID_CHARS = set('<>:"|?*\\')
-    # Invalid characters for macOS
-    MACOS_INVALID_CHARS = set(":")
-    # Invalid characters for Linux (most are allowed, but these are problematic)
-    LINUX_INVALID_CHARS = set("/\0")
+def _load_clonefile():
+    """Look up macOS clonefile(2) through ctypes, or return None if unavailable"""
+    if sys.platform != "darwin":
+        return None
+    try:
+        import ctypes
 
-    # Control characters (0x00-0x1F, 0x7F)
-    CONTROL_CHARS = set(chr(i) for i in range(32) if i != 9) | {chr(127)}
+        libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile
 
-    def __init__(self):
+
+_clonefile = _load_clonefile()
+
+
+def _reflink_copy(src, dst):
+    """
+    Copy a file as a copy-on-write clone when the filesystem supports it
+    (APFS via clonefile, Btrfs/XFS via FICLONE), falling back to shutil.copy2
+    Returns dst like shutil.copy2, so it can be used as copytree's copy_function
+    """
+    try:
+        if _clonefile is not None:
+            if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+        elif fcntl is not None and sys.platform.startswith("linux"):
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            shutil.copystat(src, dst)
+            return dst
+    except OSError:
+        # Not supported here (different filesystem, no reflink support, etc.)
         pass
+    return shutil.copy2(src, dst)
 
-    def is_valid_filename(self, filename: str) -> bool:
-        """
-        Check if filename is valid across major operating systems
-        """
-        if not filename or filename.strip() == "":
-            return False
 
-        # Check for invalid characters
-        invalid_chars = (
-            self.WINDOWS_INVALID_CHARS
-            | self.MACOS_INVALID_CHARS
-            | self.LINUX_INVALID_CHARS
-            | self.CONTROL_CHARS
-        )
+@lru_cache(maxsize=4096)
+def is_valid_filename(filename: str) -> bool:
+    """
+    Check if filename is valid across major operating systems
+    The result depends only on the filename string, so it is memoized
+    """
+    # Check length (Windows MAX_PATH is 260, but we'll be more conservative)
+    # Blank names are rejected too; isspace() checks that without a stripped copy
+    if len(filename) > 255 or not filename or filename.isspace():
+        return False
 
-        if any(char in invalid_chars for char in filename):
-            return False
+    return _INVALID_FILENAME_RE.search(filename) is None
 
-        # Windows reserved names
-        windows_reserved = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
-
-        name_upper = filename.upper().split(".")[0]
-        if name_upper in windows_reserved:
-            return False
 
-        # Check for trailing periods/spaces (invalid on Windows)
-        if filename.endswith(".") or filename.endswith(" "):
-            return False
+def create_backup(source: Path, backup_path: Path) -> bool:
+    """
+    Create a backup of a file or folder
+    Returns True if successful, False otherwise
+    """
+    try:
+        # If backup already exists, add a number suffix
+        backup_path = _free_backup_path(backup_path)
 
-        # Check length (Windows MAX_PATH is 260, but we'll be more conservative)
-        if len(filename) > 255:
+        if source.is_file():
+            _reflink_copy(source, backup_path)
+        elif source.is_dir():
+            shutil.copytree(
+                source,
+                backup_path,
+                copy_function=_reflink_copy,
+                dirs_exist_ok=False,
+            )
+        else:
             return False
 
         return True
+    except Exception as e:
+        print(f"Backup error: {e}")
+        return False
 
-    def create_backup(self, source: Path, backup_path: Path) -> bool:
-        """
-        Create a backup of a file or folder
-        Returns True if successful, False otherwise
-        """
-        try:
-            # If backup already exists, add a number suffix
-            if backup_path.exists():
-                base = backup_path
-                counter = 1
-                while backup_path.exists():
-                    backup_path = base.parent / f"{base.name} ({counter})"
-                    counter += 1
-
-            if source.is_file():
-                shutil.copy2(source, backup_path)
-            elif source.is_dir():
-                shutil.copytree(source, backup_path, dirs_exist_ok=False)
-            else:
-                return False
-
-            return True
-        except Exception as e:
-            print(f"Backup error: {e}")
-            return False
 
-    def rename_file(self, old_path: Path, new_path: Path) -> bool:
-        """
-        Safely rename a file or folder
-        Uses atomic operations where possible
-        Returns True if successful, False otherwise
-        """
+def _free_backup_path(base: Path) -> Path:
+    """
+    Get base if nothing exists there yet, else the next free "<name> (N)" path
+    One directory listing answers both questions instead of a stat per candidate
+    """
+    try:
+        # Casefolded, so case-insensitive filesystems can't hide a collision
+        entries = {name.casefold() for name in os.listdir(base.parent)}
+    except OSError:
+        # Directory can't be listed - fall back to probing candidates
+        if not os.path.lexists(base):
+            return base
+        counter = 1
+        backup_path = base.parent / f"{base.name} ({counter})"
+        while os.path.lexists(backup_path):
+            counter += 1
+            backup_path = base.parent / f"{base.name} ({counter})"
+        return backup_path
+
+    if base.name.casefold() not in entries:
+        return base
+    suffix_pattern = re.compile(rf"{re.escape(base.name.casefold())} \((\d+)\)")
+    numbers = [
+        int(match.group(1))
+        for name in entries
+        if (match := suffix_pattern.fullmatch(name))
+    ]
+    return base.parent / f"{base.name} ({max(numbers, default=0) + 1})"
+
+
+def rename_file(old_path: Path, new_path: Path) -> RenameResult:
+    """
+    Safely rename a file or folder
+    Uses atomic operations where possible; paths may be str or Path
+    Returns a RenameResult, which is truthy only if successful
+    """
+    try:
+        # Validate new filename (cached, no syscalls)
+        if not is_valid_filename(os.path.basename(new_path)):
+            return RenameResult.FAILED
+
+        # One stat call covers both existence and file/directory type
         try:
-            # Validate paths
-            if not old_path.exists():
-                return False
-
-            if new_path.exists() and new_path != old_path:
-                return False
-
-            # Validate new filename
-            if not self.is_valid_filename(new_path.name):
-                return False
-
-            # For files, try atomic rename first (most OSes support this)
-            if old_path.is_file():
-                # Use replace() which is atomic on most systems
-                old_path.replace(new_path)
-                return True
-            elif old_path.is_dir():
-                # For directories, rename is usually atomic but not always
-                # Use rename() which should work on all platforms
-                old_path.rename(new_path)
-                return True
-            else:
-                return False
-
-        except PermissionError:
-            # File might be in use
-            return False
-        except OSError as e:
-            # Various OS errors (disk full, etc.)
-            print(f"Rename error: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            return False
+            mode = os.stat(old_path).st_mode
+        except FileNotFoundError:
+            return RenameResult.FAILED
 
-    def safe_rename_with_retry(
-        self, old_path: Path, new_path: Path, max_retries: int = 3
-    ) -> bool:
-        """
-        Attempt rename with retries (useful for network drives or locked files)
-        """
-        for attempt in range(max_retries):
-            if self.rename_file(old_path, new_path):
-                return True
-            if attempt < max_retries - 1:
-                time.sleep(0.1)  # Brief pause before retry
-        return False
+        if new_path != old_path and os.path.lexists(new_path):
+            return RenameResult.FAILED
+
+        if stat.S_ISREG(mode) or stat.S_ISDIR(mode):
+            # os.replace() is atomic on most systems and works for both files
+            # and directories; calling it directly skips the pathlib wrappers
+            os.replace(old_path, new_path)
+            return RenameResult.OK
+        else:
+            return RenameResult.FAILED
+
+    except PermissionError:
+        # File might be in use
+        return RenameResult.TRANSIENT
+    except OSError as e:
+        # Various OS errors (disk full, etc.)
+        print(f"Rename error: {e}")
+        return RenameResult.FAILED
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return RenameResult.FAILED
+
+
+def safe_rename_with_retry(
+    old_path: Path, new_path: Path, max_retries: int = 3
+) -> bool:
+    """
+    Attempt rename with retries (useful for network drives or locked files)
+    Only transient failures are retried, with exponential backoff and jitter
+    """
+    for attempt in range(max_retries):
+        result = rename_file(old_path, new_path)
+        if result is not RenameResult.TRANSIENT:
+            return bool(result)
+        if attempt < max_retries - 1:
+            delay = _RETRY_BASE_DELAY * (2**attempt) + random.random() * 0.005
+            time.sleep(min(delay, _RETRY_MAX_DELAY))
+    return False
+
+
+def rename_many(pairs, max_workers: int = None) -> list:
+    """
+    Rename many (old_path, new_path) pairs concurrently
+    Renames are syscall-bound, so overlapping them helps on network drives
+    Pairs touching the same path or a parent/child of it run in input order
+    Returns one RenameResult per pair, in input order
+    """
+    pairs = list(pairs)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    groups = _dependent_groups(pairs)
+    results = [RenameResult.FAILED] * len(pairs)
+
+    def run_group(indices):
+        for i in indices:
+            results[i] = rename_file(*pairs[i])
+
+    if len(groups) <= 1 or max_workers <= 1:
+        for indices in groups:
+            run_group(indices)
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as ex:
+        # Consume the iterator so worker exceptions are raised here
+        list(ex.map(run_group, groups))
+    return results
+
+
+def _dependent_groups(pairs) -> list:
+    """
+    Split rename pairs into groups that must run serially, in input order
+    Two pairs depend on each other when any of their paths are equal or one is
+    an ancestor of the other (e.g. renaming a folder and a file inside it)
+    """
+    parent = list(range(len(pairs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        parent[find(j)] = find(i)
+
+    exact = {}  # path -> index of a pair that touches it
+    contains = {}  # directory -> indices of the pairs touching something inside it
+    for i, pair in enumerate(pairs):
+        for path in pair:
+            path = os.path.abspath(os.fspath(path))
+            # A later path that equals or sits inside an earlier one
+            ancestor = path
+            while True:
+                if ancestor in exact:
+                    union(exact[ancestor], i)
+                head = os.path.dirname(ancestor)
+                if head == ancestor:
+                    break
+                inside = contains.setdefault(head, [])
+                if not inside or inside[-1] != i:
+                    inside.append(i)
+                ancestor = head
+            # A later path that is a directory above earlier ones: every pair
+            # inside it joins its group (siblings stay independent otherwise)
+            inside = contains.get(path)
+            if inside:
+                for j in inside:
+                    if j != i:
+                        union(j, i)
+                # Now all one group, so one index stands for them from here on
+                contains[path] = [i]
+            exact.setdefault(path, i)
+
+    groups = {}
+    for i in range(len(pairs)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+class FileOperations:
+    """
+    Safe file operations for renaming
+    Kept for existing callers; every method is one of the module-level functions
+    """
+
+    WINDOWS_INVALID_CHARS = WINDOWS_INVALID_CHARS
+    MACOS_INVALID_CHARS = MACOS_INVALID_CHARS
+    LINUX_INVALID_CHARS = LINUX_INVALID_CHARS
+    CONTROL_CHARS = CONTROL_CHARS
+
+    is_valid_filename = staticmethod(is_valid_filename)
+    create_backup = staticmethod(create_backup)
+    rename_file = staticmethod(rename_file)
+    safe_rename_with_retry = staticmethod(safe_rename_with_retry)
+    rename_many = staticmethod(rename_many)
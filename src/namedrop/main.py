@@ -9,7 +9,13 @@ GitHub: @RichLewis007
 import sys
 import os
 import random
+import re
 import string
+import unicodedata
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, combinations
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
@@ -24,191 +30,438 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QGroupBox,
     QTextEdit,
+    QPlainTextEdit,
     QScrollArea,
     QDialog,
     QDialogButtonBox,
-    QSizePolicy,
 )
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtCore import (
     Qt,
+    QObject,
     QSettings,
     QPoint,
     QSize,
-    QRect,
     Signal,
-    QStandardPaths,
+    Slot,
+    QTimer,
     QFile,
     QIODevice,
+    QRunnable,
+    QThreadPool,
 )
 from PySide6.QtGui import (
     QDragEnterEvent,
     QDropEvent,
     QColor,
     QTextCharFormat,
+    QTextLayout,
     QFont,
-    QTextCursor,
     QPainter,
     QBrush,
     QPen,
 )
 
-from .file_operations import FileOperations
-from .character_utils import CharacterUtils
+from .file_operations import (
+    create_backup,
+    is_valid_filename,
+    rename_file,
+)
+from .character_utils import (
+    auto_fix_name,
+    find_non_standard_ascii,
+    get_common_allowed_chars,
+    is_all_standard_ascii,
+    remove_bad_chars,
+    replace_accented_chars,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformSpec:
+    """File name restrictions of one platform"""
+
+    name: str
+    excluded_chars: frozenset
+    problematic_chars: frozenset
+    # Tuples rather than frozensets, so the info panel lists them in a fixed order
+    excluded_positions: tuple
+    # Uppercased on construction, so case-insensitive checks need no per-call upper()
+    reserved_names: frozenset
+    max_path_length: int
+    max_filename_length: int
+    additional_restrictions: tuple
+    description: str
+    # Sorted copies of the sets above for display, filled in on construction
+    excluded_sorted: tuple = field(init=False)
+    problematic_sorted: tuple = field(init=False)
+    reserved_sorted: tuple = field(init=False)
+
+    def __post_init__(self):
+        reserved_names = frozenset(n.upper() for n in self.reserved_names)
+        object.__setattr__(self, "reserved_names", reserved_names)
+        object.__setattr__(self, "excluded_sorted", tuple(sorted(self.excluded_chars)))
+        object.__setattr__(
+            self, "problematic_sorted", tuple(sorted(self.problematic_chars))
+        )
+        object.__setattr__(self, "reserved_sorted", tuple(sorted(reserved_names)))
 
 
+# Restrictions shared by several platforms below, each built once
+# Windows reserved device names (OneDrive and FAT32 follow Windows), plus . and ..
+_WIN_RESERVED_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+    | {".", ".."}
+)
+_WIN_EXCLUDED_CHARS = frozenset('<>:"|?*\\/')
+_PROBLEMATIC_CHARS = frozenset("!@#$%^&()[]{};,=+")
+
 # Platform compatibility data
 PLATFORM_RESTRICTIONS = {
-    "Everything": {
-        "name": "Everything (All Platforms)",
-        "excluded_chars": set(
-            '<>:"|?*\\/'
-        ),  # No spaces - spaces are allowed, only position matters
-        "problematic_chars": set("!@#$%^&()[]{};,=+"),  # No spaces
-        "excluded_positions": ["trailing_space", "trailing_period", "leading_space"],
-        "reserved_names": set(),  # Windows reserved names (case-insensitive check done separately)
-        "max_path_length": 260,  # Windows default MAX_PATH
-        "max_filename_length": 255,  # Conservative limit for all platforms
-        "additional_restrictions": ["no_space_period_after_ext", "no_spaces_only"],
-        "description": "Most restrictive - ensures compatibility with Windows, macOS, Linux, and all cloud platforms",
-    },
-    "Windows": {
-        "name": "Windows OS",
-        "excluded_chars": set(
-            '<>:"|?*\\/'
-        ),  # No spaces - spaces are allowed, only position matters
-        "problematic_chars": set(),
-        "excluded_positions": ["trailing_space", "trailing_period"],
-        "reserved_names": {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-            ".",
-            "..",
-        },  # Reserved directory names
-        "max_path_length": 260,  # MAX_PATH default
-        "max_filename_length": 255,  # Filename length limit
-        "additional_restrictions": ["no_space_period_after_ext", "no_spaces_only"],
-        "description": "Windows file system restrictions. Trailing spaces and periods are automatically stripped.",
-    },
-    "macOS": {
-        "name": "macOS",
-        "excluded_chars": set(":/"),  # No spaces
-        "problematic_chars": set(),
-        "excluded_positions": [],
-        "reserved_names": set(),
-        "max_path_length": 255,  # Filename length limit
-        "max_filename_length": 255,  # Filename length limit
-        "additional_restrictions": [],
-        "description": "macOS allows most characters. Only colon (:) and forward slash (/) are forbidden.",
-    },
-    "Linux": {
-        "name": "Linux",
-        "excluded_chars": set("/"),  # No spaces
-        "problematic_chars": set(),
-        "excluded_positions": [],
-        "reserved_names": set(),
-        "max_path_length": 255,  # Filename length limit (bytes)
-        "max_filename_length": 255,  # Filename length limit (bytes)
-        "additional_restrictions": [],
-        "description": "Linux is very permissive. Only forward slash (/) is forbidden.",
-    },
-    "Cloud": {
-        "name": "Cloud Drives",
-        "excluded_chars": set(
-            '<>:"|?*\\/'
-        ),  # No spaces - spaces are allowed, only position matters
-        "problematic_chars": set("!@#$%^&()[]{};,=+"),  # No spaces
-        "excluded_positions": ["trailing_space", "trailing_period"],
-        "reserved_names": {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",  # Windows reserved names (OneDrive follows Windows)
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-            ".",
-            "..",
-        },  # Reserved directory names
-        "max_path_length": 260,  # Windows-based cloud services
-        "max_filename_length": 255,  # Filename length limit
-        "additional_restrictions": ["no_space_period_after_ext", "no_spaces_only"],
-        "description": "Cloud platforms (OneDrive, Dropbox, etc.) typically follow Windows restrictions for compatibility.",
-    },
-    "FAT32": {
-        "name": "FAT32",
-        "excluded_chars": set('<>:"|?*\\/'),  # Same as Windows
-        "problematic_chars": set(),
-        "excluded_positions": ["trailing_space", "trailing_period"],
-        "reserved_names": {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",  # Same as Windows
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-            ".",
-            "..",
-        },  # Reserved directory names
-        "max_path_length": 260,  # Similar to Windows
-        "max_filename_length": 255,  # LFN (Long File Name) limit, 8.3 format is 11 chars (8+3)
-        "additional_restrictions": ["no_space_period_after_ext", "no_spaces_only"],
-        "description": "FAT32 file system (common on USB drives). Windows rejects names ending with space or period. Supports LFN up to 255 characters. Uses 8.3 format (8+3=11 chars) for compatibility.",
-    },
+    "Everything": PlatformSpec(
+        name="Everything (All Platforms)",
+        excluded_chars=_WIN_EXCLUDED_CHARS,  # No spaces - only their position matters
+        problematic_chars=_PROBLEMATIC_CHARS,  # No spaces
+        excluded_positions=("trailing_space", "trailing_period", "leading_space"),
+        reserved_names=frozenset(),  # Windows reserved names (case-insensitive check done separately)
+        max_path_length=260,  # Windows default MAX_PATH
+        max_filename_length=255,  # Conservative limit for all platforms
+        additional_restrictions=("no_space_period_after_ext", "no_spaces_only"),
+        description="Most restrictive - ensures compatibility with Windows, macOS, Linux, and all cloud platforms",
+    ),
+    "Windows": PlatformSpec(
+        name="Windows OS",
+        excluded_chars=_WIN_EXCLUDED_CHARS,  # No spaces - only their position matters
+        problematic_chars=frozenset(),
+        excluded_positions=("trailing_space", "trailing_period"),
+        reserved_names=_WIN_RESERVED_NAMES,  # Reserved directory names
+        max_path_length=260,  # MAX_PATH default
+        max_filename_length=255,  # Filename length limit
+        additional_restrictions=("no_space_period_after_ext", "no_spaces_only"),
+        description="Windows file system restrictions. Trailing spaces and periods are automatically stripped.",
+    ),
+    "macOS": PlatformSpec(
+        name="macOS",
+        excluded_chars=frozenset(":/"),  # No spaces
+        problematic_chars=frozenset(),
+        excluded_positions=(),
+        reserved_names=frozenset(),
+        max_path_length=255,  # Filename length limit
+        max_filename_length=255,  # Filename length limit
+        additional_restrictions=(),
+        description="macOS allows most characters. Only colon (:) and forward slash (/) are forbidden.",
+    ),
+    "Linux": PlatformSpec(
+        name="Linux",
+        excluded_chars=frozenset("/"),  # No spaces
+        problematic_chars=frozenset(),
+        excluded_positions=(),
+        reserved_names=frozenset(),
+        max_path_length=255,  # Filename length limit (bytes)
+        max_filename_length=255,  # Filename length limit (bytes)
+        additional_restrictions=(),
+        description="Linux is very permissive. Only forward slash (/) is forbidden.",
+    ),
+    "Cloud": PlatformSpec(
+        name="Cloud Drives",
+        excluded_chars=_WIN_EXCLUDED_CHARS,  # No spaces - only their position matters
+        problematic_chars=_PROBLEMATIC_CHARS,  # No spaces
+        excluded_positions=("trailing_space", "trailing_period"),
+        reserved_names=_WIN_RESERVED_NAMES,  # Reserved directory names
+        max_path_length=260,  # Windows-based cloud services
+        max_filename_length=255,  # Filename length limit
+        additional_restrictions=("no_space_period_after_ext", "no_spaces_only"),
+        description="Cloud platforms (OneDrive, Dropbox, etc.) typically follow Windows restrictions for compatibility.",
+    ),
+    "FAT32": PlatformSpec(
+        name="FAT32",
+        excluded_chars=_WIN_EXCLUDED_CHARS,  # Same as Windows
+        problematic_chars=frozenset(),
+        excluded_positions=("trailing_space", "trailing_period"),
+        reserved_names=_WIN_RESERVED_NAMES,  # Reserved directory names
+        max_path_length=260,  # Similar to Windows
+        max_filename_length=255,  # LFN (Long File Name) limit, 8.3 format is 11 chars (8+3)
+        additional_restrictions=("no_space_period_after_ext", "no_spaces_only"),
+        description="FAT32 file system (common on USB drives). Windows rejects names ending with space or period. Supports LFN up to 255 characters. Uses 8.3 format (8+3=11 chars) for compatibility.",
+    ),
+}
+
+
+def _combine_restrictions(platform_keys):
+    """Union the character and position restrictions of the given platforms"""
+    platforms = [PLATFORM_RESTRICTIONS[key] for key in platform_keys]
+    excluded_chars = frozenset().union(*(p.excluded_chars for p in platforms))
+    problematic_chars = frozenset().union(*(p.problematic_chars for p in platforms))
+    # Spaces are never removed by the filter - only their position matters
+    removable_chars = (excluded_chars | problematic_chars) - {" "}
+    excluded_positions = frozenset().union(*(p.excluded_positions for p in platforms))
+    return {
+        "excluded_chars": excluded_chars,
+        "problematic_chars": problematic_chars,
+        "excluded_positions": excluded_positions,
+        # Characters to strip from the front of a name, for one lstrip call
+        "leading_strip_chars": ("." if "leading_period" in excluded_positions else "")
+        + (" " if "leading_space" in excluded_positions else ""),
+        "removable_chars": removable_chars,
+        # Most restrictive filename length limit, None if no platform sets one
+        "max_filename_length": min(
+            (p.max_filename_length for p in platforms if p.max_filename_length),
+            default=None,
+        ),
+        # str.translate table deleting removable_chars, used when nothing is ignored
+        "translate_table": str.maketrans("", "", "".join(removable_chars)),
+    }
+
+
+# Combined restrictions for every subset of platforms (2^6 = 64 entries), so a
+# selection change is a dict lookup instead of rebuilding the unions
+_COMBINED_RESTRICTIONS = {
+    frozenset(subset): _combine_restrictions(subset)
+    for subset in chain.from_iterable(
+        combinations(PLATFORM_RESTRICTIONS, r)
+        for r in range(len(PLATFORM_RESTRICTIONS) + 1)
+    )
+}
+
+
+@lru_cache(maxsize=256)
+def _scan_non_standard_ascii(name, ignore_chars):
+    """
+    Cached find_non_standard_ascii for a name and frozen ignore set
+    The same names are rescanned as the ignore settings and platforms change
+    """
+    return frozenset(find_non_standard_ascii(name, ignore_chars))
+
+
+@lru_cache(maxsize=128)
+def _cleaned_name(fix, name, ignore_chars):
+    """
+    Cached fix(name, ignore_chars) for the clean buttons' character_utils fixes
+    Cancelling a preview and clicking again, or trying another button, reuses it
+    """
+    return fix(name, ignore_chars)
+
+
+# Queued files beyond this count are scanned in the background (see PrescanWorker)
+_PRESCAN_THRESHOLD = 4
+
+
+def _path_key(path):
+    """
+    Key identifying a file regardless of how its path was spelled
+    ("./a.txt" vs "a.txt", symlinks, and case on Windows)
+    """
+    return os.path.normcase(os.path.realpath(path))
+
+
+# Stylesheets for the status label, by state (see NameDropApp.set_status_style)
+_STATUS_STYLES = {
+    "info": "padding: 5px; background-color: #e3f2fd;",
+    "ok": "padding: 5px; background-color: #e8f5e9;",
+    "success": "padding: 5px; background-color: #e8f5e9; color: #2e7d32;",
+    "warning": "padding: 5px; background-color: #fff3e0;",
+    "error": "padding: 5px; background-color: #ffebee; color: #c62828;",
+}
+# All of them as one stylesheet, selected by the label's "status" property
+_STATUS_QSS = "\n".join(
+    f'QLabel[status="{state}"] {{ {style} }}' for state, style in _STATUS_STYLES.items()
+)
+
+# Stylesheet for the platform buttons, set on the group box that holds them
+_PLATFORM_BUTTON_STYLE = """
+    QPushButton {
+        padding: 8px 15px;
+        border: 2px solid #ccc;
+        border-radius: 5px;
+        background-color: #f5f5f5;
+    }
+    QPushButton:hover {
+        background-color: #e3f2fd;
+        border-color: #0066cc;
+    }
+    QPushButton:checked {
+        background-color: #4CAF50;
+        color: white;
+        border-color: #45a049;
+    }
+"""
+
+# Platform buttons in display order, and every one but "Everything"
+_PLATFORM_KEYS = ("Everything", "Windows", "macOS", "Linux", "Cloud", "FAT32")
+_SPECIFIC_PLATFORM_KEYS = _PLATFORM_KEYS[1:]
+
+# Characters check_leading_trailing_issues flags at either end of a name
+_EDGE_CHAR_NAMES = {" ": "space", ".": "period"}
+_EDGE_CHARS = tuple(_EDGE_CHAR_NAMES)
+
+
+def _utf16_len(text):
+    """Length of text in UTF-16 code units, the unit of Qt text positions"""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+@lru_cache(maxsize=64)
+def _highlight_pattern(chars):
+    """Compiled regex matching runs of any of chars (a frozenset)"""
+    return re.compile("[" + re.escape("".join(sorted(chars))) + "]+")
+
+
+def _strip_trailing_periods(name):
+    """Remove trailing periods but keep the one before extension (if it exists)"""
+    # Split filename and extension at the last period (no period, nothing to do)
+    name_part, dot, ext_part = name.rpartition(".")
+    if not dot:
+        return name
+    # Remove trailing periods from name part only; a name made of nothing but
+    # periods is emptied
+    name_part = name_part.rstrip(".")
+    return f"{name_part}.{ext_part}" if name_part or ext_part else ""
+
+
+def _compile_filter(restrictions, translate_table):
+    """
+    Build the compatibility filter function for one set of combined restrictions
+    The position checks are decided here once, not on every call
+    """
+    trailing_space = "trailing_space" in restrictions["excluded_positions"]
+    trailing_period = "trailing_period" in restrictions["excluded_positions"]
+    leading_strip_chars = restrictions["leading_strip_chars"]
+
+    def compatibility_filter(name):
+        # Remove excluded and problematic characters in one pass
+        name = name.translate(translate_table)
+        # Handle position restrictions - only remove spaces at specific positions
+        if trailing_space:
+            name = name.rstrip(" ")
+        if trailing_period:
+            name = _strip_trailing_periods(name)
+        if leading_strip_chars:
+            name = name.lstrip(leading_strip_chars)
+        return name
+
+    return compatibility_filter
+
+
+# Wording of excluded_positions and additional_restrictions entries in the info text
+_POSITION_DESCRIPTIONS = {
+    "trailing_space": "Trailing space",
+    "trailing_period": "Trailing period",
+    "leading_space": "Leading space",
+    "leading_period": "Leading period",
+}
+_ADDITIONAL_DESCRIPTIONS = {
+    "no_space_period_after_ext": "Cannot end with space/period before extension",
+    "no_spaces_only": "Cannot consist solely of spaces",
 }
 
 
+def _restriction_items(platform):
+    """
+    (label, HTML) pairs for each restriction a platform has, in display order
+    Shared by the selection summary and the hover details, which only wrap them
+    differently
+    """
+    items = []
+
+    # Excluded characters
+    if platform.excluded_chars:
+        excluded_list = platform.excluded_sorted
+        excluded_display = " ".join(
+            f"<code>{c}</code>" if c != " " else "<code>space</code>"
+            for c in excluded_list
+        )
+        items.append(("Excluded characters", excluded_display))
+
+    # Problematic characters
+    if platform.problematic_chars:
+        problematic_list = platform.problematic_sorted
+        problematic_display = " ".join(f"<code>{c}</code>" for c in problematic_list)
+        items.append(("Problematic characters", problematic_display))
+
+    # Position restrictions
+    if platform.excluded_positions:
+        positions = [
+            _POSITION_DESCRIPTIONS.get(p, p) for p in platform.excluded_positions
+        ]
+        items.append(("Position restrictions", ", ".join(positions)))
+
+    # Reserved names
+    if platform.reserved_names:
+        reserved_list = platform.reserved_sorted
+        reserved_display = ", ".join(
+            f"<code>{name}</code>" for name in reserved_list[:10]
+        )  # Show first 10
+        if len(reserved_list) > 10:
+            reserved_display += f" <i>(and {len(reserved_list) - 10} more)</i>"
+        items.append(("Reserved names", reserved_display))
+
+    # Length restrictions
+    length_info = []
+    if platform.max_filename_length:
+        length_info.append(
+            f"Max filename: {platform.max_filename_length} characters"
+        )
+    if platform.max_path_length:
+        length_info.append(f"Max path: {platform.max_path_length} characters")
+    if length_info:
+        items.append(("Length restrictions", ", ".join(length_info)))
+
+    # Additional restrictions
+    if platform.additional_restrictions:
+        addl_list = [
+            _ADDITIONAL_DESCRIPTIONS.get(r, r) for r in platform.additional_restrictions
+        ]
+        items.append(("Additional restrictions", ", ".join(addl_list)))
+
+    return items
+
+
+def _build_section_html(platform):
+    """Build one platform's section of the selected-platforms restriction summary"""
+    lines = [f"<b>{platform.name}:</b>"]
+    lines.extend(
+        f"  • <b>{label}:</b> {display}"
+        for label, display in _restriction_items(platform)
+    )
+    lines.append(f"  • <i>{platform.description}</i>")
+    lines.append("")
+    return "<br>".join(lines)
+
+
+def _build_hover_html(platform):
+    """Build the restriction details shown while hovering a platform button"""
+    parts = [f"<b>{platform.name}:</b><br><br>"]
+    parts.extend(
+        f"<b>{label}:</b> {display}<br>"
+        for label, display in _restriction_items(platform)
+    )
+    parts.append(f"<br><i>{platform.description}</i>")
+    return "".join(parts)
+
+
+# PLATFORM_RESTRICTIONS never changes, so the HTML shown for each platform is
+# built once here instead of on every hover and click
+_SECTION_HTML = {
+    key: _build_section_html(platform)
+    for key, platform in PLATFORM_RESTRICTIONS.items()
+}
+_HOVER_HTML = {
+    key: _build_hover_html(platform) for key, platform in PLATFORM_RESTRICTIONS.items()
+}
+
+# Character pools for generate_random_filename
+_RANDOM_EXCLUDED_CHARS = '<>:"|?*\\/'
+_RANDOM_PROBLEMATIC_CHARS = "!@#$%^&()[]{};,=+"
+_RANDOM_NON_ASCII_CHARS = "éñüàçöäßøåæœ€£¥"
+_RANDOM_SAFE_CHARS = string.ascii_letters + string.digits + "._- "
+_RANDOM_EXTENSIONS = ("txt", "pdf", "doc", "jpg", "png", "mp3", "zip")
+# Generated excluded/problematic characters are highlighted along with non-ASCII
+_RANDOM_HIGHLIGHT_CHARS = frozenset(_RANDOM_EXCLUDED_CHARS + _RANDOM_PROBLEMATIC_CHARS)
+
+
 class LeadingTrailingIssueDialog(QDialog):
     """Dialog to show leading/trailing space/period issues and offer to fix"""
 
@@ -294,18 +547,18 @@ class RenamePreviewDialog(QDialog):
         layout = QVBoxLayout()
 
         layout.addWidget(QLabel("Original name:"))
-        old_label = QLabel(self.old_name)
-        old_label.setStyleSheet(
+        self.old_label = QLabel(self.old_name)
+        self.old_label.setStyleSheet(
             "font-size: 12pt; padding: 5px; background-color: #f0f0f0;"
         )
-        layout.addWidget(old_label)
+        layout.addWidget(self.old_label)
 
         layout.addWidget(QLabel("New name:"))
-        new_label = QLabel(self.new_name)
-        new_label.setStyleSheet(
+        self.new_label = QLabel(self.new_name)
+        self.new_label.setStyleSheet(
             "font-size: 12pt; padding: 5px; background-color: #e8f5e9;"
         )
-        layout.addWidget(new_label)
+        layout.addWidget(self.new_label)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
@@ -314,28 +567,58 @@ class RenamePreviewDialog(QDialog):
 
         self.setLayout(layout)
 
-
-class LEDIndicator(QLabel):
-    """Realistic LED light indicator"""
+    def set_names(self, old_name: str, new_name: str):
+        """Show a different rename, so one dialog can be reused"""
+        self.old_name = old_name
+        self.new_name = new_name
+        self.old_label.setText(old_name)
+        self.new_label.setText(new_name)
+
+
+class LEDIndicator(QWidget):
+    """
+    Realistic LED light indicator
+    A plain QWidget, since it only paints; QLabel's text handling was never used
+    """
+
+    # Colors by name, and the painting tools shared by every LED (built once)
+    COLORS = {
+        "green": QColor(0, 255, 0),
+        "yellow": QColor(255, 255, 0),
+        "red": QColor(255, 0, 0),
+        "orange": QColor(255, 165, 0),
+        "purple": QColor(128, 0, 128),
+        "gray": QColor(128, 128, 128),
+        "off": QColor(80, 80, 80),
+    }
+    _RING_BRUSH = QBrush(QColor(40, 40, 40))
+    _RING_PEN = QPen(QColor(60, 60, 60), 1)
+    _NO_PEN = QPen(QColor(0, 0, 0, 0))  # No border
+    _HIGHLIGHT_BRUSH = QBrush(QColor(255, 255, 255, 100))
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self.color = QColor(128, 128, 128)  # Default gray (off)
-        self.setStyleSheet("background-color: transparent;")
+        self._body_brush = QBrush(self.color)
+        self._lit = False
+        self._color_name = "gray"  # Name last passed to set_color
+
+    def sizeHint(self):
+        return QSize(20, 20)
 
     def set_color(self, color_name):
         """Set LED color by name"""
-        colors = {
-            "green": QColor(0, 255, 0),
-            "yellow": QColor(255, 255, 0),
-            "red": QColor(255, 0, 0),
-            "orange": QColor(255, 165, 0),
-            "purple": QColor(128, 0, 128),
-            "gray": QColor(128, 128, 128),
-            "off": QColor(80, 80, 80),
-        }
-        self.color = colors.get(color_name.lower(), QColor(128, 128, 128))
+        # Same name as last time: skip the lookup and the QColor comparison
+        if color_name == self._color_name:
+            return
+        self._color_name = color_name
+        color = self.COLORS.get(color_name.lower(), self.COLORS["gray"])
+        if color == self.color:
+            return  # Nothing to repaint
+        self.color = color
+        self._body_brush = QBrush(color)
+        self._lit = color != self.COLORS["gray"]  # Not gray/off
         self.update()  # Trigger repaint
 
     def paintEvent(self, event):
@@ -344,31 +627,27 @@ class LEDIndicator(QLabel):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw outer ring (dark)
-        painter.setBrush(QBrush(QColor(40, 40, 40)))
-        painter.setPen(QPen(QColor(60, 60, 60), 1))
+        painter.setBrush(self._RING_BRUSH)
+        painter.setPen(self._RING_PEN)
         painter.drawEllipse(2, 2, 16, 16)
 
-        # Draw LED body with gradient effect
-        if self.color.name() != "#808080":  # Not gray/off
-            # Create gradient for 3D effect
-            gradient = QBrush(self.color)
-            painter.setBrush(gradient)
-            painter.setPen(QPen(QColor(0, 0, 0, 0)))  # No border
-            painter.drawEllipse(4, 4, 12, 12)
+        # Draw LED body
+        painter.setBrush(self._body_brush)
+        painter.setPen(self._NO_PEN)
+        painter.drawEllipse(4, 4, 12, 12)
 
+        if self._lit:
             # Add highlight for 3D effect
-            highlight_color = QColor(255, 255, 255, 100)
-            painter.setBrush(QBrush(highlight_color))
+            painter.setBrush(self._HIGHLIGHT_BRUSH)
             painter.drawEllipse(5, 5, 5, 5)
-        else:
-            # Gray/off state
-            painter.setBrush(QBrush(self.color))
-            painter.setPen(QPen(QColor(0, 0, 0, 0)))
-            painter.drawEllipse(4, 4, 12, 12)
 
 
-class FileNameDisplay(QTextEdit):
-    """Widget to display and edit file name with highlighted non-standard ASCII characters"""
+class FileNameDisplay(QPlainTextEdit):
+    """
+    Widget to display and edit file name with highlighted non-standard ASCII characters
+    A plain text edit is used since character formats are all the highlighting needs;
+    it skips QTextEdit's rich-text document layout
+    """
 
     text_edited = Signal(str)  # Signal emitted when user edits the text
 
@@ -379,37 +658,56 @@ class FileNameDisplay(QTextEdit):
         self.setStyleSheet("font-size: 18pt; font-weight: bold; padding: 10px;")
         self.app_reference = None  # Will store reference to parent app
         self.ignore_chars = set()
-        self.char_utils = None
         self._updating = False  # Flag to prevent recursive updates
+        # Debounces rescans while typing, so a burst of keystrokes triggers one
+        # rescan and highlight pass instead of one each
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(40)
+        self._rescan_timer.timeout.connect(self._rescan)
+
+        # Font and character formats, built once instead of on every highlight pass
+        self._font = QFont("Arial", 18, QFont.Bold)
+        self._format_normal = QTextCharFormat()
+        self._format_normal.setFont(self._font)
+        self._format_highlight = QTextCharFormat()
+        self._format_highlight.setBackground(QColor(255, 255, 0))  # Yellow highlight
+        self._format_highlight.setFont(self._font)
 
         # Connect text change signal to update highlighting
         self.textChanged.connect(self.on_text_changed)
 
     def set_app_reference(self, app):
-        """Set reference to parent app to access ignore_chars and char_utils"""
+        """Set reference to parent app to access ignore_chars and its analyzer"""
         self.app_reference = app
-        if app:
-            self.char_utils = app.char_utils
 
     def on_text_changed(self):
-        """Update highlighting when text changes"""
+        """Update highlighting when text changes (once typing pauses)"""
         if self._updating:
             return
+        if self.app_reference:
+            self._rescan_timer.start()
 
+    def flush_pending_edit(self):
+        """Run a rescan still waiting on the debounce timer right away"""
+        if self._rescan_timer.isActive():
+            self._rescan_timer.stop()
+            self._rescan()
+
+    def _rescan(self):
+        """Rehighlight the typed text and report it to the app"""
         text = self.toPlainText()
         if self.app_reference:
             ignore_chars = self.app_reference.get_ignore_chars()
-            bad_chars = (
-                self.char_utils.find_non_standard_ascii(text, ignore_chars)
-                if self.char_utils
-                else set()
-            )
-            bad_chars = bad_chars - ignore_chars
+            # The app's analyzer already leaves out ignore_chars and caches scans
+            bad_chars = self.app_reference.get_analyzer()(text)
             self.update_highlighting(text, bad_chars, ignore_chars)
             self.text_edited.emit(text)
 
     def set_file_name(self, file_name: str, bad_chars: set, ignore_chars: set):
         """Display file name with bad characters highlighted"""
+        # The new name replaces any typing the timer has not handled yet
+        self._rescan_timer.stop()
         self._updating = True  # Prevent recursive updates
         self.ignore_chars = ignore_chars
 
@@ -433,58 +731,90 @@ class FileNameDisplay(QTextEdit):
         # Set updating flag to prevent recursion
         self._updating = True
 
-        # Store cursor position
-        cursor = self.textCursor()
-        old_position = cursor.position()
-
-        # Clear and rebuild with highlighting
-        self.clear()
-
-        cursor = self.textCursor()
-        format_normal = QTextCharFormat()
-        format_normal.setFont(QFont("Arial", 18, QFont.Bold))
-
-        format_highlight = QTextCharFormat()
-        format_highlight.setBackground(QColor(255, 255, 0))  # Yellow highlight
-        format_highlight.setFont(QFont("Arial", 18, QFont.Bold))
-
-        # Check for length restrictions if app reference is available
-        length_exceeded_chars = set()
+        # Rebuild with repaints and signals held back, so Qt lays out and paints
+        # once at the end instead of after every insert
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self._rebuild_highlighting(file_name, bad_chars, ignore_chars)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+            # Clear updating flag
+            self._updating = False
+
+    def _rebuild_highlighting(self, file_name: str, bad_chars: set, ignore_chars: set):
+        """Show file_name with its bad characters and any overflow highlighted"""
+        if self.toPlainText() != file_name:
+            # Only new text needs the document rebuilt. Highlighting is applied as
+            # layout formats below, which leave the text, cursor and undo history alone
+            cursor = self.textCursor()
+            old_position = cursor.position()
+            self.clear()
+            cursor = self.textCursor()
+            cursor.insertText(file_name, self._format_normal)
+            # Restore cursor position if possible
+            if old_position <= len(file_name):
+                cursor.setPosition(min(old_position, len(file_name)))
+                self.setTextCursor(cursor)
+
+        # Find the most restrictive max_filename_length if app reference is available
         max_length = None
         if self.app_reference and self.app_reference.selected_platforms:
-            length_exceeded_chars = self.app_reference.get_length_restriction_chars(
-                file_name
-            )
-            # Find the most restrictive max_filename_length
-            for platform_key in self.app_reference.selected_platforms:
-                platform = PLATFORM_RESTRICTIONS.get(platform_key)
-                if platform:
-                    max_len = platform.get("max_filename_length")
-                    if max_len and (max_length is None or max_len < max_length):
-                        max_length = max_len
-
-        for i, char in enumerate(file_name):
-            # Highlight if character is in bad_chars (and not in ignore_chars) OR exceeds length limit
-            should_highlight = char in bad_chars
-            if should_highlight and ignore_chars:
-                should_highlight = char not in ignore_chars
-
-            # Also highlight if this character position exceeds length limit
-            if not should_highlight and max_length and i >= max_length:
-                should_highlight = True
-
-            if should_highlight:
-                cursor.insertText(char, format_highlight)
-            else:
-                cursor.insertText(char, format_normal)
-
-        # Restore cursor position if possible
-        if old_position <= len(file_name):
-            cursor.setPosition(min(old_position, len(file_name)))
-            self.setTextCursor(cursor)
+            max_length = self.app_reference.get_active_restrictions()[
+                "max_filename_length"
+            ]
 
-        # Clear updating flag
-        self._updating = False
+        # Characters in bad_chars (and not in ignore_chars) are highlighted, as is
+        # everything past the length limit
+        effective_bad = bad_chars - ignore_chars if ignore_chars else bad_chars
+        if max_length:
+            within_limit, over_limit = file_name[:max_length], file_name[max_length:]
+        else:
+            within_limit, over_limit = file_name, ""
+
+        # (start, length) of each highlighted run, in Qt's UTF-16 positions
+        ranges = []
+        position = 0
+        if not effective_bad.isdisjoint(within_limit):
+            # The regex scanner finds whole runs of bad characters in C
+            previous_end = 0
+            pattern = _highlight_pattern(frozenset(effective_bad))
+            for match in pattern.finditer(within_limit):
+                start, end = match.span()
+                position += _utf16_len(within_limit[previous_end:start])
+                length = _utf16_len(match.group())
+                ranges.append((position, length))
+                position += length
+                previous_end = end
+            position += _utf16_len(within_limit[previous_end:])
+        else:
+            # Nothing to highlight before the limit: no scan at all
+            position = _utf16_len(within_limit)
+        if over_limit:
+            ranges.append((position, _utf16_len(over_limit)))
+        self._set_highlight_ranges(ranges)
+
+    def _set_highlight_ranges(self, ranges):
+        """Apply highlight ranges (document positions) as each block's layout formats"""
+        document = self.document()
+        block = document.firstBlock()
+        while block.isValid():
+            block_start = block.position()
+            block_end = block_start + block.length()
+            formats = []
+            for start, length in ranges:
+                start, end = max(start, block_start), min(start + length, block_end)
+                if start < end:
+                    format_range = QTextLayout.FormatRange()
+                    format_range.start = start - block_start
+                    format_range.length = end - start
+                    format_range.format = self._format_highlight
+                    formats.append(format_range)
+            block.layout().setFormats(formats)
+            block = block.next()
+        document.markContentsDirty(0, document.characterCount())
 
     def get_text(self):
         """Get the current text from the display"""
@@ -510,6 +840,48 @@ class PlatformButton(QPushButton):
         self.hover_left.emit()
 
 
+class PrescanSignals(QObject):
+    """Signals of a PrescanWorker (a QRunnable can't have signals itself)"""
+
+    # Batch number, normalized file name, its non-standard characters
+    scanned = Signal(int, str, object)
+
+
+class PrescanWorker(QRunnable):
+    """
+    Scan queued file names on a pool thread and send each result back to the GUI
+    thread, so the scans are done by the time each file is shown
+    """
+
+    def __init__(
+        self,
+        batch: int,
+        file_paths,
+        normalization: str,
+        ignore_chars: frozenset,
+        signals: PrescanSignals,
+    ):
+        super().__init__()
+        self.batch = batch
+        self.file_paths = file_paths
+        self.normalization = normalization
+        self.ignore_chars = ignore_chars
+        self.signals = signals
+
+    def run(self):
+        for file_path in self.file_paths:
+            # Same name NameDropApp.normalize_file_name will produce
+            file_name = unicodedata.normalize(
+                self.normalization, os.path.basename(file_path)
+            )
+            # Clean names take the analyzer's own fast path, no result needed
+            if not is_all_standard_ascii(file_name):
+                bad_chars = frozenset(
+                    find_non_standard_ascii(file_name, self.ignore_chars)
+                )
+                self.signals.scanned.emit(self.batch, file_name, bad_chars)
+
+
 class DragDropWidget(QWidget):
     """Widget that accepts drag and drop of files/folders"""
 
@@ -552,28 +924,124 @@ class NameDropApp(QMainWindow):
     """Main application window"""
 
     def __init__(self):
-        super().__init__()
+        # Stay-on-top is given at construction, so the native window is created
+        # with it instead of having its flags changed afterwards
+        super().__init__(None, Qt.Window | Qt.WindowStaysOnTopHint)
         self.settings = QSettings("NameDrop", "NameDrop")
         self.current_file_path = None
         self.current_file_name = None
-        self.processed_files = set()  # Track ignored files
-        self.selected_platforms = set()  # Track selected platform compatibility buttons
-        self.platform_selection_order = []  # Track order of platform selection (most recent first)
+        self.processed_files = set()  # Track ignored files, by _path_key
+        # _path_key of current_file_path, and the path it was computed for
+        self._current_key = None
+        self._current_key_path = None
+        # Selected platform compatibility buttons, in selection order (most recent
+        # first), keys only
+        self.selected_platforms = OrderedDict()
         self.compatibility_filtered_name = (
             None  # Store the filtered name based on selected platforms
         )
-
-        self.char_utils = CharacterUtils()
-        self.file_ops = FileOperations()
+        # str.translate table for apply_compatibility_filter, built lazily and
+        # cleared whenever the selected platforms or ignored characters change
+        self._translate_table = None
+        # Compatibility filter function built from that table, cleared along with it
+        self._filter_pipeline = None
+        # Combined restrictions of selected_platforms, cleared along with them too
+        self._active_restrictions = None
+        # Restrictions info HTML, keyed by the platforms in display order
+        self._info_cache = {}
+        # Inputs of the last apply_compatibility_filter run that updated the display,
+        # cleared by anything else that redraws it
+        self._last_filter_sig = None
+        # Set while a compatibility refresh is queued (see _schedule_filter)
+        self._filter_dirty = False
+        # Name perform_rename just gave the file from the filter's output (see there)
+        self._post_rename_hint = None
+        # Dropped files still waiting to be shown, in drop order
+        self._pending_files = deque()
+        # Background scans of the current batch: name -> non-standard characters,
+        # valid for the ignore set they were made with (see PrescanWorker)
+        self._prescan_batch = 0
+        self._prescanned = {}
+        self._prescan_ignore = None
+        self._prescan_signals = None
+        # Folder -> (entry names, casefolded entry names), see _target_exists
+        self._dir_cache = {}
+        # Rename target edit_name has already found to be free (see perform_rename)
+        self._vacant_path = None
+        # Named widgets of the loaded .ui, indexed once while init_ui sets it up
+        self._ui_widgets = None
+        # Dialogs built on first use and reused afterwards
+        self._edit_dialog = None
+        self._edit_field = None
+        self._preview_dialog = None
+        # Debounces re-analysis while the ignore settings are being edited, so a
+        # burst of keystrokes triggers one on_file_selected instead of one each
+        self._reanalyze_timer = QTimer(self)
+        self._reanalyze_timer.setSingleShot(True)
+        self._reanalyze_timer.setInterval(150)
+        self._reanalyze_timer.timeout.connect(self._reanalyze)
+        # Ignore characters the current analysis was made with
+        self._analyzed_ignore_chars = None
+        # Unicode form dropped names are shown in ("NFC", or "NFD" as macOS stores them)
+        self.name_normalization = "NFC"
+
+        # Bad-character finder specialized for the ignore settings it was built for
+        self._analyzer = None
+        self._analyzer_key = None
+        # Frozen ignore characters, cleared whenever the ignore settings change
+        self._ignore_chars_frozen = None
+        # The file name editor is created on first use (see file_name_display)
+        self._file_name_display = None
+        self._file_name_display_slot = None
+        # Saved screen to center on, applied on first show (see showEvent)
+        self._pending_screen = None
+        # Path of an ignored file whose "ignored" state is already on screen
+        self._suppressed_path = None
 
         self.init_ui()
         self.load_settings()
+        # Build the deferred widgets once the event loop is idle after startup
+        QTimer.singleShot(0, self._prewarm_heavy_ui)
+
+    @property
+    def file_name_display(self):
+        """The file name editor, created the first time it is needed"""
+        if self._file_name_display is None:
+            self._create_file_name_display()
+        return self._file_name_display
+
+    def _add_file_name_display_slot(self, layout, index=-1):
+        """Reserve the file name editor's place in layout with a cheap placeholder"""
+        placeholder = QWidget()
+        layout.insertWidget(index, placeholder)
+        self._file_name_display_slot = (layout, placeholder)
+
+    def _create_file_name_display(self):
+        """Create the file name editor and swap it in for its placeholder"""
+        display = FileNameDisplay()
+        display.set_app_reference(self)  # Give it reference to app
+        display.text_edited.connect(self.on_filename_edited)
+        self._file_name_display = display
+        if self._file_name_display_slot:
+            layout, placeholder = self._file_name_display_slot
+            self._file_name_display_slot = None
+            layout.insertWidget(layout.indexOf(placeholder), display)
+            layout.removeWidget(placeholder)
+            placeholder.deleteLater()
+
+    def _prewarm_heavy_ui(self):
+        """Create deferred widgets after the first paint, ahead of the first drop"""
+        if self._file_name_display is None:
+            self._create_file_name_display()
 
     def init_ui(self):
         """Initialize the user interface from UI file"""
         # Load UI file using best practices for PySide6
         ui_file_path = Path(__file__).parent / "ui" / "main.ui"
         if ui_file_path.exists():
+            # QtUiTools is only needed here, so it is not loaded with this module
+            from PySide6.QtUiTools import QUiLoader
+
             loader = QUiLoader()
             ui_file = QFile(str(ui_file_path))
 
@@ -628,24 +1096,18 @@ class NameDropApp(QMainWindow):
                     layout.insertWidget(1, self.drag_drop)
 
                 # Replace file_name_display with custom FileNameDisplay
-                file_name_display = self.ui.findChild(QTextEdit, "file_name_display")
+                file_name_display = self._find_ui_widget(QTextEdit, "file_name_display")
                 if file_name_display:
                     file_name_index = layout.indexOf(file_name_display)
                     layout.removeWidget(file_name_display)
                     file_name_display.deleteLater()
-                    self.file_name_display = FileNameDisplay()
-                    self.file_name_display.set_app_reference(self)
-                    self.file_name_display.text_edited.connect(self.on_filename_edited)
-                    layout.insertWidget(file_name_index, self.file_name_display)
+                    self._add_file_name_display_slot(layout, file_name_index)
                 else:
-                    self.file_name_display = FileNameDisplay()
-                    self.file_name_display.set_app_reference(self)
-                    self.file_name_display.text_edited.connect(self.on_filename_edited)
-                    layout.addWidget(self.file_name_display)
+                    self._add_file_name_display_slot(layout)
 
                 # Get button references
-                self.random_btn = self.ui.findChild(QPushButton, "random_btn")
-                self.rename_btn = self.ui.findChild(QPushButton, "rename_btn")
+                self.random_btn = self._find_ui_widget(QPushButton, "random_btn")
+                self.rename_btn = self._find_ui_widget(QPushButton, "rename_btn")
 
                 # Connect button signals
                 if self.random_btn:
@@ -659,6 +1121,7 @@ class NameDropApp(QMainWindow):
 
             except Exception as e:
                 print(f"Error loading UI file: {e}")
+                self._ui_widgets = None
                 # Fallback to programmatic UI
                 self._init_ui_programmatic()
                 return  # Don't add missing sections, they're already in the programmatic UI
@@ -670,13 +1133,28 @@ class NameDropApp(QMainWindow):
         # Add missing sections that aren't in the UI file (only if UI file loaded successfully)
         if hasattr(self, "ui"):
             self._add_missing_sections()
+        # Setup is done; don't keep the widgets it replaced alive
+        self._ui_widgets = None
 
         self.setWindowTitle("NameDrop")
         self.resize(800, 700)
 
+    def _find_ui_widget(self, cls, name):
+        """
+        self.ui.findChild(cls, name), answered from an index of the loaded UI's
+        named widgets instead of a tree walk per lookup
+        """
+        if self._ui_widgets is None:
+            self._ui_widgets = {}
+            for widget in self.ui.findChildren(QWidget):
+                if widget.objectName():
+                    self._ui_widgets.setdefault(widget.objectName(), widget)
+        widget = self._ui_widgets.get(name)
+        return widget if isinstance(widget, cls) else None
+
     def _replace_led_widgets(self):
         """Replace QWidget LEDs with LEDIndicator widgets"""
-        detection_group = self.ui.findChild(QGroupBox, "detection_group")
+        detection_group = self._find_ui_widget(QGroupBox, "detection_group")
         if not detection_group:
             return
 
@@ -692,33 +1170,18 @@ class NameDropApp(QMainWindow):
             "FAT32": ("fat32_led", "fat32_label"),
         }
 
+        # The LEDs sit in sub-layouts of platforms_layout and legend_layout (their
+        # parent widget is the group box), so map each widget to its sub-layout once
+        containing_layouts = self._sub_layouts_by_widget(platforms_layout)
+
         self.platform_leds = {}
         for platform_key, (led_name, label_name) in platform_map.items():
-            led_widget = self.ui.findChild(QWidget, led_name)
-            if led_widget:
-                # Find parent layout
-                parent = led_widget.parent()
-                if parent:
-                    layout = None
-                    for i in range(platforms_layout.count()):
-                        item = platforms_layout.itemAt(i)
-                        if item and item.layout():
-                            for j in range(item.layout().count()):
-                                sub_item = item.layout().itemAt(j)
-                                if sub_item and sub_item.widget() == led_widget:
-                                    layout = item.layout()
-                                    break
-                            if layout:
-                                break
-
-                    if layout:
-                        index = layout.indexOf(led_widget)
-                        layout.removeWidget(led_widget)
-                        led_widget.deleteLater()
-                        led = LEDIndicator()
-                        led.set_color("gray")
-                        layout.insertWidget(index, led)
-                        self.platform_leds[platform_key] = led
+            led_widget = self._find_ui_widget(QWidget, led_name)
+            layout = containing_layouts.get(led_widget)
+            if layout:
+                self.platform_leds[platform_key] = self._swap_for_led(
+                    layout, led_widget, "gray"
+                )
 
         # Replace legend LEDs
         legend_layout = detection_layout.itemAt(1).layout()
@@ -730,25 +1193,38 @@ class NameDropApp(QMainWindow):
             "purple_led": "purple",
         }
 
+        containing_layouts = self._sub_layouts_by_widget(legend_layout)
         for led_name, color in legend_leds.items():
-            led_widget = self.ui.findChild(QWidget, led_name)
-            if led_widget:
-                # Find parent layout
-                for i in range(legend_layout.count()):
-                    item = legend_layout.itemAt(i)
-                    if item and item.layout():
-                        for j in range(item.layout().count()):
-                            sub_item = item.layout().itemAt(j)
-                            if sub_item and sub_item.widget() == led_widget:
-                                layout = item.layout()
-                                index = layout.indexOf(led_widget)
-                                layout.removeWidget(led_widget)
-                                led_widget.deleteLater()
-                                led = LEDIndicator()
-                                led.set_color(color)
-                                led.setFixedSize(16, 16)
-                                layout.insertWidget(index, led)
-                                break
+            led_widget = self._find_ui_widget(QWidget, led_name)
+            layout = containing_layouts.get(led_widget)
+            if layout:
+                self._swap_for_led(layout, led_widget, color, size=16)
+
+    @staticmethod
+    def _swap_for_led(layout, old_widget, color, size=None):
+        """Put a new LEDIndicator in old_widget's place in layout and return it"""
+        index = layout.indexOf(old_widget)
+        layout.removeWidget(old_widget)
+        old_widget.deleteLater()
+        led = LEDIndicator()
+        led.set_color(color)
+        if size:
+            led.setFixedSize(size, size)
+        layout.insertWidget(index, led)
+        return led
+
+    @staticmethod
+    def _sub_layouts_by_widget(layout):
+        """Map each widget in the direct sub-layouts of layout to its sub-layout"""
+        containing = {}
+        for i in range(layout.count()):
+            sub_layout = layout.itemAt(i).layout()
+            if sub_layout:
+                for j in range(sub_layout.count()):
+                    widget = sub_layout.itemAt(j).widget()
+                    if widget:
+                        containing[widget] = sub_layout
+        return containing
 
     def _add_missing_sections(self):
         """Add sections that are missing from the UI file"""
@@ -762,45 +1238,24 @@ class NameDropApp(QMainWindow):
             return
 
         # Find detection_group to insert after it
-        detection_group = self.ui.findChild(QGroupBox, "detection_group")
+        detection_group = self._find_ui_widget(QGroupBox, "detection_group")
         detection_index = layout.indexOf(detection_group) if detection_group else -1
 
         # Platform compatibility section
         compatibility_group = QGroupBox("Make compatible with:")
+        # One stylesheet for all the platform buttons, parsed once
+        compatibility_group.setStyleSheet(_PLATFORM_BUTTON_STYLE)
         compatibility_layout = QVBoxLayout()
 
         # Platform buttons (horizontal)
         buttons_layout = QHBoxLayout()
         self.platform_buttons = {}
-        platform_keys = ["Everything", "Windows", "macOS", "Linux", "Cloud", "FAT32"]
-
-        for platform_key in platform_keys:
+        for platform_key in _PLATFORM_KEYS:
             btn = PlatformButton(
-                platform_key, PLATFORM_RESTRICTIONS[platform_key]["name"]
+                platform_key, PLATFORM_RESTRICTIONS[platform_key].name
             )
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 8px 15px;
-                    border: 2px solid #ccc;
-                    border-radius: 5px;
-                    background-color: #f5f5f5;
-                }
-                QPushButton:hover {
-                    background-color: #e3f2fd;
-                    border-color: #0066cc;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-color: #45a049;
-                }
-            """)
-            btn.clicked.connect(
-                lambda checked, key=platform_key: self.on_platform_button_clicked(
-                    key, checked
-                )
-            )
+            btn.clicked.connect(self._on_platform_clicked)
             btn.hover_entered.connect(self.on_platform_button_hover)
             btn.hover_left.connect(self.on_platform_button_leave)
             buttons_layout.addWidget(btn)
@@ -847,15 +1302,19 @@ class NameDropApp(QMainWindow):
         ignore_layout = QVBoxLayout()
         self.ignore_common_check = QCheckBox("Ignore common special characters")
         self.ignore_common_check.setChecked(True)
-        self.ignore_common_check.stateChanged.connect(self.on_file_selected)
+        self.ignore_common_check.stateChanged.connect(self.invalidate_ignore_chars)
+        self.ignore_common_check.stateChanged.connect(self.invalidate_translate_table)
+        self.ignore_common_check.stateChanged.connect(self.schedule_reanalysis)
         ignore_layout.addWidget(self.ignore_common_check)
 
-        self.ignore_chars_edit = QLineEdit(self.char_utils.get_common_allowed_chars())
+        self.ignore_chars_edit = QLineEdit(get_common_allowed_chars())
         self.ignore_chars_edit.setPlaceholderText(
             "Characters to ignore (separated by spaces)"
         )
+        self.ignore_chars_edit.textChanged.connect(self.invalidate_ignore_chars)
+        self.ignore_chars_edit.textChanged.connect(self.invalidate_translate_table)
         self.ignore_chars_edit.textChanged.connect(self.save_allowed_chars)
-        self.ignore_chars_edit.textChanged.connect(self.on_file_selected)
+        self.ignore_chars_edit.textChanged.connect(self.schedule_reanalysis)
         ignore_layout.addWidget(QLabel("Allowed characters:"))
         ignore_layout.addWidget(self.ignore_chars_edit)
         ignore_group.setLayout(ignore_layout)
@@ -908,7 +1367,7 @@ class NameDropApp(QMainWindow):
 
         # Status label
         self.status_label = QLabel("Ready - Drop a file or folder")
-        self.status_label.setStyleSheet("padding: 5px; background-color: #e3f2fd;")
+        self.set_status_style("info")
         layout.insertWidget(insert_index + 4, self.status_label)
 
     def _init_ui_programmatic(self):
@@ -975,10 +1434,7 @@ class NameDropApp(QMainWindow):
         filename_header_layout.addWidget(self.rename_btn)
         layout.addLayout(filename_header_layout)
 
-        self.file_name_display = FileNameDisplay()
-        self.file_name_display.set_app_reference(self)  # Give it reference to app
-        self.file_name_display.text_edited.connect(self.on_filename_edited)
-        layout.addWidget(self.file_name_display)
+        self._add_file_name_display_slot(layout)
 
         # Detection section with LED indicators
         detection_group = QGroupBox("Detecting..")
@@ -1041,40 +1497,19 @@ class NameDropApp(QMainWindow):
 
         # Platform compatibility section
         compatibility_group = QGroupBox("Make compatible with:")
+        # One stylesheet for all the platform buttons, parsed once
+        compatibility_group.setStyleSheet(_PLATFORM_BUTTON_STYLE)
         compatibility_layout = QVBoxLayout()
 
         # Platform buttons (horizontal)
         buttons_layout = QHBoxLayout()
         self.platform_buttons = {}
-        platform_keys = ["Everything", "Windows", "macOS", "Linux", "Cloud", "FAT32"]
-
-        for platform_key in platform_keys:
+        for platform_key in _PLATFORM_KEYS:
             btn = PlatformButton(
-                platform_key, PLATFORM_RESTRICTIONS[platform_key]["name"]
+                platform_key, PLATFORM_RESTRICTIONS[platform_key].name
             )
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 8px 15px;
-                    border: 2px solid #ccc;
-                    border-radius: 5px;
-                    background-color: #f5f5f5;
-                }
-                QPushButton:hover {
-                    background-color: #e3f2fd;
-                    border-color: #0066cc;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-color: #45a049;
-                }
-            """)
-            btn.clicked.connect(
-                lambda checked, key=platform_key: self.on_platform_button_clicked(
-                    key, checked
-                )
-            )
+            btn.clicked.connect(self._on_platform_clicked)
             btn.hover_entered.connect(self.on_platform_button_hover)
             btn.hover_left.connect(self.on_platform_button_leave)
             buttons_layout.addWidget(btn)
@@ -1121,18 +1556,22 @@ class NameDropApp(QMainWindow):
         ignore_layout = QVBoxLayout()
         self.ignore_common_check = QCheckBox("Ignore common special characters")
         self.ignore_common_check.setChecked(True)
-        self.ignore_common_check.stateChanged.connect(self.on_file_selected)
+        self.ignore_common_check.stateChanged.connect(self.invalidate_ignore_chars)
+        self.ignore_common_check.stateChanged.connect(self.invalidate_translate_table)
+        self.ignore_common_check.stateChanged.connect(self.schedule_reanalysis)
         ignore_layout.addWidget(self.ignore_common_check)
 
-        self.ignore_chars_edit = QLineEdit(self.char_utils.get_common_allowed_chars())
+        self.ignore_chars_edit = QLineEdit(get_common_allowed_chars())
         self.ignore_chars_edit.setPlaceholderText(
             "Characters to ignore (separated by spaces)"
         )
+        self.ignore_chars_edit.textChanged.connect(self.invalidate_ignore_chars)
+        self.ignore_chars_edit.textChanged.connect(self.invalidate_translate_table)
         # Auto-save when text changes so it persists even if app crashes
         self.ignore_chars_edit.textChanged.connect(self.save_allowed_chars)
         # Update display when ignore chars change (but only if we have a file selected)
-        # Note: We use on_file_selected which will safely update the display
-        self.ignore_chars_edit.textChanged.connect(self.on_file_selected)
+        # Note: on_file_selected runs once typing pauses and safely updates the display
+        self.ignore_chars_edit.textChanged.connect(self.schedule_reanalysis)
         ignore_layout.addWidget(QLabel("Allowed characters:"))
         ignore_layout.addWidget(self.ignore_chars_edit)
         ignore_group.setLayout(ignore_layout)
@@ -1185,7 +1624,7 @@ class NameDropApp(QMainWindow):
 
         # Status label
         self.status_label = QLabel("Ready - Drop a file or folder")
-        self.status_label.setStyleSheet("padding: 5px; background-color: #e3f2fd;")
+        self.set_status_style("info")
         layout.addWidget(self.status_label)
 
         self.setWindowTitle("NameDrop")
@@ -1217,6 +1656,38 @@ class NameDropApp(QMainWindow):
         self.move(pos)
         self.resize(size)
 
+        # Centering on the saved screen needs the real frame geometry, which is
+        # only known once the window is shown
+        self._pending_screen = screen
+
+        # Checkbox states
+        self.prompt_check.setChecked(
+            self.settings.value("prompt_before_rename", True, type=bool)
+        )
+        self.backup_check.setChecked(
+            self.settings.value("always_backup", True, type=bool)
+        )
+        self.ignore_common_check.setChecked(
+            self.settings.value("ignore_common_chars", True, type=bool)
+        )
+
+        # Ignore characters
+        ignore_chars = self.settings.value("ignore_chars", get_common_allowed_chars())
+        self.ignore_chars_edit.setText(ignore_chars)
+
+        # Unicode normalization applied to dropped file names
+        name_normalization = self.settings.value("name_normalization", "NFC")
+        if name_normalization in ("NFC", "NFD"):
+            self.name_normalization = name_normalization
+
+    def showEvent(self, event):
+        """Center on the saved screen the first time the window is shown"""
+        super().showEvent(event)
+        screen, self._pending_screen = self._pending_screen, None
+        if screen is None:
+            return
+        screens = QApplication.screens()
+
         # Move to saved screen if available
         if screens and 0 <= screen < len(screens):
             screen_geometry = screens[screen].geometry()
@@ -1235,27 +1706,11 @@ class NameDropApp(QMainWindow):
             )
             self.move(QPoint(x, y))
 
-        # Checkbox states
-        self.prompt_check.setChecked(
-            self.settings.value("prompt_before_rename", True, type=bool)
-        )
-        self.backup_check.setChecked(
-            self.settings.value("always_backup", True, type=bool)
-        )
-        self.ignore_common_check.setChecked(
-            self.settings.value("ignore_common_chars", True, type=bool)
-        )
-
-        # Ignore characters
-        ignore_chars = self.settings.value(
-            "ignore_chars", self.char_utils.get_common_allowed_chars()
-        )
-        self.ignore_chars_edit.setText(ignore_chars)
-
     def save_allowed_chars(self):
         """Save allowed characters immediately when changed"""
+        # No sync() here: QSettings writes pending changes to disk from the event
+        # loop shortly afterwards, so a burst of keystrokes costs one write
         self.settings.setValue("ignore_chars", self.ignore_chars_edit.text())
-        self.settings.sync()  # Force immediate write to disk
 
     def save_settings(self):
         """Save current settings"""
@@ -1265,17 +1720,17 @@ class NameDropApp(QMainWindow):
 
         # Validate and clamp position before saving to prevent invalid positions
         screens = QApplication.screens()
+        # Screen containing the window center. Qt already tracks the window's screen,
+        # so screenAt's search is only needed if the center lies elsewhere (window
+        # straddling screens or off-screen) or there is no native window yet
+        center = window_geometry.center()
+        handle = self.windowHandle()
+        current_screen = handle.screen() if handle is not None else None
+        if current_screen is None or not current_screen.geometry().contains(center):
+            current_screen = QApplication.screenAt(center)
         if screens:
-            # Check if window center is within any screen
-            window_center = window_geometry.center()
-            is_valid = False
-            for screen in screens:
-                if screen.geometry().contains(window_center):
-                    is_valid = True
-                    break
-
             # If window is outside all screens, clamp position to primary screen
-            if not is_valid and screens:
+            if current_screen is None:
                 primary_screen = screens[0]
                 screen_rect = primary_screen.geometry()
 
@@ -1293,14 +1748,11 @@ class NameDropApp(QMainWindow):
         self.settings.setValue("window_position", pos)
         self.settings.setValue("window_size", size)
 
-        # Find which screen the window is on (using current geometry)
-        screen_num = 0
-        if screens:
-            current_geometry = self.frameGeometry()
-            for i, screen in enumerate(screens):
-                if screen.geometry().contains(current_geometry.center()):
-                    screen_num = i
-                    break
+        # Remember which screen the window is on (one search of the list)
+        try:
+            screen_num = screens.index(current_screen)
+        except ValueError:
+            screen_num = 0
         self.settings.setValue("screen", screen_num)
 
         self.settings.setValue("prompt_before_rename", self.prompt_check.isChecked())
@@ -1309,6 +1761,9 @@ class NameDropApp(QMainWindow):
             "ignore_common_chars", self.ignore_common_check.isChecked()
         )
         self.settings.setValue("ignore_chars", self.ignore_chars_edit.text())
+        self.settings.setValue("name_normalization", self.name_normalization)
+        # One write to disk for everything above
+        self.settings.sync()
 
     def closeEvent(self, event):
         """Save settings when closing"""
@@ -1320,89 +1775,147 @@ class NameDropApp(QMainWindow):
         if not files:
             return
 
-        # Filter to only existing files/folders
-        valid_files = [f for f in files if os.path.exists(f)]
+        # Folder listings from an earlier drop may be out of date by now
+        self._dir_cache.clear()
+
+        # Filter to only existing files/folders. Files dropped together from one
+        # folder are checked against a single listing of it (which the rename
+        # checks reuse afterwards) instead of a stat each
+        split_paths = [os.path.split(f) for f in files]
+        per_folder = Counter(parent for parent, _ in split_paths)
+        valid_files = [
+            f
+            for f, (parent, name) in zip(files, split_paths)
+            if (
+                self._target_exists(parent, name)
+                if name and per_folder[parent] > 1
+                else os.path.exists(f)
+            )
+        ]
 
         if not valid_files:
             self.status_label.setText("Error: No valid files found")
-            self.status_label.setStyleSheet(
-                "padding: 5px; background-color: #ffebee; color: #c62828;"
-            )
+            self.set_status_style("error")
             return
 
-        # Handle first file (could be extended to support batch processing)
-        file_path = valid_files[0]
-        if len(valid_files) > 1:
-            self.status_label.setText(
-                f"Processing first of {len(valid_files)} files. Drop again for next file."
+        # Queue them all; each successful rename moves on to the next one
+        self._pending_files = deque(valid_files)
+        self._advance()
+        # A new drop replaces the previous batch's scans; late results from its
+        # worker are told apart by the batch number
+        self._prescan_batch += 1
+        self._prescanned = {}
+        if len(self._pending_files) > _PRESCAN_THRESHOLD:
+            # Larger batches: scan the rest in the background, keeping the
+            # current file's scan synchronous. The results go into a dict owned
+            # by the batch, so none are evicted however large the batch is
+            if self._prescan_signals is None:
+                self._prescan_signals = PrescanSignals(self)
+                self._prescan_signals.scanned.connect(self._on_prescanned)
+            self._prescan_ignore = self.get_ignore_chars()
+            QThreadPool.globalInstance().start(
+                PrescanWorker(
+                    self._prescan_batch,
+                    list(self._pending_files),
+                    self.name_normalization,
+                    self._prescan_ignore,
+                    self._prescan_signals,
+                )
             )
-            self.status_label.setStyleSheet("padding: 5px; background-color: #fff3e0;")
 
-        if os.path.exists(file_path):
-            self.current_file_path = file_path
-            self.current_file_name = os.path.basename(file_path)
-            self.compatibility_filtered_name = None
-            # Reset platform selections when new file is dropped
-            for btn in self.platform_buttons.values():
-                btn.setChecked(False)
-            self.selected_platforms = set()
-            self.platform_selection_order = []
-            self.update_compatibility_info()
-            self.on_file_selected()
-        else:
-            self.status_label.setText(f"Error: File not found - {file_path}")
-            self.status_label.setStyleSheet(
-                "padding: 5px; background-color: #ffebee; color: #c62828;"
-            )
+    @Slot(int, str, object)
+    def _on_prescanned(self, batch, file_name, bad_chars):
+        """Store a background scan result of the current batch"""
+        if batch == self._prescan_batch:
+            self._prescanned[file_name] = bad_chars
+
+    def _advance(self, done_message=None):
+        """
+        Load the next queued file (existence already checked when it was dropped)
+        done_message reports what happened to the previous file; it is kept in front
+        of the new file's status instead of being replaced by it
+        """
+        if not self._pending_files:
+            return
+        file_path = self._pending_files.popleft()
+        skipped = 0
+        if self.processed_files:
+            # Files ignored earlier are passed over while others are still queued;
+            # shown, they would stall the batch with every action disabled
+            while self._pending_files and _path_key(file_path) in self.processed_files:
+                file_path = self._pending_files.popleft()
+                skipped += 1
+        self.current_file_path = file_path
+        # A dropped file is shown afresh, even if it is the ignored one
+        self._suppressed_path = None
+        # Nothing has been edited or filtered for this file yet
+        self.rename_btn.setEnabled(False)
+        # Normalized once here, so repeated on_file_selected calls reuse it
+        self.current_file_name = self.normalize_file_name(os.path.basename(file_path))
+        self.compatibility_filtered_name = None
+        # Reset platform selections when new file is dropped
+        self._set_platform_buttons_checked(self.platform_buttons, False)
+        self.selected_platforms.clear()
+        self.invalidate_translate_table()
+        self.update_compatibility_info()
+        self.on_file_selected()
+        status = self.status_label.text()
+        if skipped:
+            status = f"Skipped {skipped} ignored file(s) - {status}"
+        if done_message:
+            status = f"{done_message} - next file: {status}"
+        remaining = len(self._pending_files)
+        if remaining:
+            status += f" ({remaining} more file(s) queued)"
+        self.status_label.setText(status)
+
+    def _advance_if_queued(self, done_message):
+        """
+        Move on to the next queued file after one that needs no rename, so clean
+        and ignored files don't stall a batch drop
+        """
+        if self._pending_files:
+            self._advance(done_message)
+
+    def schedule_reanalysis(self):
+        """Re-run on_file_selected once the ignore settings stop changing"""
+        # Restarting a running single-shot timer pushes the timeout back
+        self._reanalyze_timer.start()
+
+    def normalize_file_name(self, file_name: str) -> str:
+        """
+        Normalize a file name to the configured Unicode form
+        macOS hands over names decomposed (NFD), which would otherwise show a base
+        letter and its accent as two separate non-standard characters
+        """
+        if file_name.isascii() or unicodedata.is_normalized(
+            self.name_normalization, file_name
+        ):
+            return file_name
+        return unicodedata.normalize(self.name_normalization, file_name)
 
     def on_file_selected(self):
         """Analyze selected file and update display"""
         if not self.current_file_path:
             return
+        if self.current_file_path == self._suppressed_path:
+            # Ignored file already shown as such; ignore-setting changes don't apply
+            return
+        self._last_filter_sig = None
 
-        # Check if file was ignored
-        if self.current_file_path in self.processed_files:
+        # Check if file was ignored (no realpath lookup while nothing is ignored)
+        if self.processed_files and self.current_file_key() in self.processed_files:
             self.status_label.setText("This file has been ignored")
-            self.status_label.setStyleSheet("padding: 5px; background-color: #fff3e0;")
-            self.ignore_btn.setEnabled(False)
-            self.auto_rename_btn.setEnabled(False)
-            self.remove_btn.setEnabled(False)
-            self.replace_btn.setEnabled(False)
-            self.edit_btn.setEnabled(False)
+            self.set_status_style("warning")
+            self._disable_action_buttons()
             self.file_name_display.set_file_name(self.current_file_name, set(), set())
+            self._suppressed_path = self.current_file_path
             return
 
-        # Get ignore characters - include all characters from the field
-        ignore_chars = self.get_ignore_chars()
-
-        # Find bad characters (excluding ignore_chars)
-        bad_chars = self.char_utils.find_non_standard_ascii(
-            self.current_file_name, ignore_chars
-        )
-
-        # Remove any ignore_chars from bad_chars to ensure they're never highlighted
-        bad_chars = bad_chars - ignore_chars
-
-        # Update LED indicators
-        self.update_platform_leds(self.current_file_name)
+        bad_chars = self._analyze_current_name()
 
-        # Apply compatibility filter if platforms are selected
-        if self.selected_platforms:
-            self.apply_compatibility_filter()
-        else:
-            # Add length restriction highlighting if needed
-            if self.selected_platforms:
-                length_bad_chars = self.get_length_restriction_chars(
-                    self.current_file_name
-                )
-                bad_chars = bad_chars | length_bad_chars
-            # Update display
-            self.file_name_display.set_file_name(
-                self.current_file_name, bad_chars, ignore_chars
-            )
-
-        # Enable buttons if there are bad characters
-        has_bad_chars = bool(bad_chars - ignore_chars)
+        # Enable buttons if there are bad characters (ignore_chars already excluded)
+        has_bad_chars = bool(bad_chars)
         self.auto_rename_btn.setEnabled(has_bad_chars)
         self.remove_btn.setEnabled(has_bad_chars)
         self.replace_btn.setEnabled(has_bad_chars)
@@ -1411,42 +1924,81 @@ class NameDropApp(QMainWindow):
 
         if has_bad_chars:
             self.status_label.setText(
-                f"Found {len(bad_chars - ignore_chars)} non-standard ASCII character(s)"
+                f"Found {len(bad_chars)} non-standard ASCII character(s)"
             )
-            self.status_label.setStyleSheet("padding: 5px; background-color: #fff3e0;")
+            self.set_status_style("warning")
         else:
             self.status_label.setText(
                 "File name contains only standard ASCII characters"
             )
-            self.status_label.setStyleSheet("padding: 5px; background-color: #e8f5e9;")
+            self.set_status_style("ok")
+
+    def set_status_style(self, state: str):
+        """
+        Style the status label for a state in _STATUS_STYLES
+        The label is given every state's rules once; later changes only switch its
+        "status" property and repolish, so no stylesheet is parsed again
+        """
+        label = self.status_label
+        if label.property("status") != state:
+            if not label.styleSheet():
+                # A newly built label (both UI builders make one)
+                label.setStyleSheet(_STATUS_QSS)
+            label.setProperty("status", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _disable_action_buttons(self):
+        """Disable the per-file action buttons (for ignored files)"""
+        for btn in (
+            self.rename_btn,
+            self.ignore_btn,
+            self.auto_rename_btn,
+            self.remove_btn,
+            self.replace_btn,
+            self.edit_btn,
+        ):
+            btn.setEnabled(False)
 
     def ignore_file(self):
         """Add current file to ignored list"""
         if self.current_file_path:
-            self.processed_files.add(self.current_file_path)
+            self.processed_files.add(self.current_file_key())
             self.status_label.setText("File ignored")
-            self.status_label.setStyleSheet("padding: 5px; background-color: #fff3e0;")
-            self.ignore_btn.setEnabled(False)
-            self.auto_rename_btn.setEnabled(False)
-            self.remove_btn.setEnabled(False)
-            self.replace_btn.setEnabled(False)
-            self.edit_btn.setEnabled(False)
+            self.set_status_style("warning")
+            self._disable_action_buttons()
+            self._advance_if_queued("File ignored")
+
+    def current_file_key(self):
+        """Get the processed_files key of the current file, cached per path"""
+        if self._current_key_path != self.current_file_path:
+            self._current_key = _path_key(self.current_file_path)
+            self._current_key_path = self.current_file_path
+        return self._current_key
 
     def update_display_for_ignore_chars_change(self):
         """Update the display when ignore characters change (to avoid recursion)"""
         if not self.current_file_name:
             return
-
+        self._last_filter_sig = None
+        self._analyze_current_name()
+
+    def _analyze_current_name(self):
+        """
+        Find the current name's bad characters and show them on the LEDs and in the
+        display (through the compatibility filter if platforms are selected)
+        Returns the bad characters, ignore_chars already excluded
+        """
         # Get ignore characters - include all characters from the field
         ignore_chars = self.get_ignore_chars()
+        self._analyzed_ignore_chars = ignore_chars
 
-        # Find bad characters (excluding ignore_chars)
-        bad_chars = self.char_utils.find_non_standard_ascii(
-            self.current_file_name, ignore_chars
-        )
-
-        # Remove any ignore_chars from bad_chars to ensure they're never highlighted
-        bad_chars = bad_chars - ignore_chars
+        # Find bad characters (excluding ignore_chars, so they're never highlighted)
+        if is_all_standard_ascii(self.current_file_name):
+            # Already-clean names (the common case) skip the analyzer entirely
+            bad_chars = set()
+        else:
+            bad_chars = self.get_analyzer()(self.current_file_name)
 
         # Update LED indicators
         self.update_platform_leds(self.current_file_name)
@@ -1455,39 +2007,69 @@ class NameDropApp(QMainWindow):
         if self.selected_platforms:
             self.apply_compatibility_filter()
         else:
-            # Add length restriction highlighting if needed
-            if self.selected_platforms:
-                length_bad_chars = self.get_length_restriction_chars(
-                    self.current_file_name
-                )
-                bad_chars = bad_chars | length_bad_chars
-            # Update display
+            # Update display (no platforms selected, so no length limit to highlight)
             self.file_name_display.set_file_name(
                 self.current_file_name, bad_chars, ignore_chars
             )
+        return bad_chars
+
+    def _reanalyze(self):
+        """Re-run on_file_selected after an ignore settings change, if it changed"""
+        # Edits that leave the ignore set as it was (a repeated character, or
+        # reordering in the field) leave the current analysis standing
+        if self.get_ignore_chars() != self._analyzed_ignore_chars:
+            self.on_file_selected()
+
+    def invalidate_ignore_chars(self):
+        """Drop the cached ignore characters so get_ignore_chars rebuilds them"""
+        self._ignore_chars_frozen = None
 
     def get_ignore_chars(self):
-        """Get set of characters to ignore"""
-        ignore_chars = set()
-        if self.ignore_common_check.isChecked():
-            ignore_text = self.ignore_chars_edit.text()
-            # Include all characters from the field, including spaces if they're in the field
-            ignore_chars = set(char for char in ignore_text)
-        return ignore_chars
+        """Get set of characters to ignore (a shared frozenset, rebuilt only on change)"""
+        if self._ignore_chars_frozen is None:
+            ignore_chars = frozenset()
+            if self.ignore_common_check.isChecked():
+                # Include all characters from the field, including spaces if they're in the field
+                ignore_chars = frozenset(self.ignore_chars_edit.text())
+            if ignore_chars == self._analyzer_key:
+                # Same characters as before (a repeat or reordering in the field):
+                # keep the old object, so the analyzer built for it is still used
+                ignore_chars = self._analyzer_key
+            self._ignore_chars_frozen = ignore_chars
+        return self._ignore_chars_frozen
+
+    def get_analyzer(self):
+        """
+        Get a function returning the non-standard characters of a name, with the
+        current ignore characters bound in. Rebuilt only when the ignore settings change
+        """
+        ignore_chars = self.get_ignore_chars()
+        if ignore_chars is not self._analyzer_key:
+            is_clean = is_all_standard_ascii
+
+            def analyze(name):
+                # Common case: printable ASCII only, nothing to scan for
+                if is_clean(name):
+                    return set()
+                # Scanned in the background already, for these same ignore_chars
+                if ignore_chars is self._prescan_ignore:
+                    found = self._prescanned.get(name)
+                    if found is not None:
+                        return set(found)
+                # Callers may add to the result, so never hand out the cached set
+                return set(_scan_non_standard_ascii(name, ignore_chars))
+
+            self._analyzer = analyze
+            self._analyzer_key = ignore_chars
+        return self._analyzer
 
     def get_length_restriction_chars(self, file_name: str):
         """Get set of characters that exceed length restrictions for selected platforms"""
         if not self.selected_platforms or not file_name:
             return set()
 
-        # Find the most restrictive max_filename_length from selected platforms
-        min_max_length = None
-        for platform_key in self.selected_platforms:
-            platform = PLATFORM_RESTRICTIONS.get(platform_key)
-            if platform:
-                max_len = platform.get("max_filename_length")
-                if max_len and (min_max_length is None or max_len < min_max_length):
-                    min_max_length = max_len
+        # Most restrictive max_filename_length from selected platforms
+        min_max_length = self.get_active_restrictions()["max_filename_length"]
 
         # If filename exceeds the limit, highlight characters beyond the limit
         if min_max_length and len(file_name) > min_max_length:
@@ -1498,196 +2080,47 @@ class NameDropApp(QMainWindow):
         return set()
 
     def get_combined_restrictions(self, platforms):
-        """Get combined restrictions from selected platforms"""
-        if not platforms:
-            return {
-                "excluded_chars": set(),
-                "problematic_chars": set(),
-                "excluded_positions": [],
-            }
-
-        excluded_chars = set()
-        problematic_chars = set()
-        excluded_positions = []
-
-        for platform_key in platforms:
-            platform = PLATFORM_RESTRICTIONS[platform_key]
-            excluded_chars.update(platform["excluded_chars"])
-            problematic_chars.update(platform["problematic_chars"])
-            excluded_positions.extend(platform["excluded_positions"])
-
-        # Remove duplicates from excluded_positions
-        excluded_positions = list(set(excluded_positions))
-
-        return {
-            "excluded_chars": excluded_chars,
-            "problematic_chars": problematic_chars,
-            "excluded_positions": excluded_positions,
-        }
+        """Get combined restrictions from selected platforms (shared, do not modify)"""
+        return _COMBINED_RESTRICTIONS[frozenset(platforms)]
+
+    def get_active_restrictions(self):
+        """
+        Get the combined restrictions of selected_platforms (shared, do not modify)
+        Looked up once per selection change instead of on every keystroke
+        """
+        if self._active_restrictions is None:
+            self._active_restrictions = self.get_combined_restrictions(
+                self.selected_platforms
+            )
+        return self._active_restrictions
 
     def format_restrictions_info(self, platforms):
         """Format restriction information for display in selection order (most recent first)"""
         if not platforms:
             return "No platforms selected."
 
-        lines = []
         # Display in selection order (most recently selected first)
-        # The platform_selection_order list already has most recent first
-        # Filter to only show platforms that are currently selected
-        display_order = [p for p in self.platform_selection_order if p in platforms]
-        # Add any platforms that are selected but not in the order list (shouldn't happen, but safety)
-        for p in platforms:
-            if p not in display_order:
-                display_order.insert(0, p)  # Add to front if missing
-
-        for platform_key in display_order:
-            platform = PLATFORM_RESTRICTIONS[platform_key]
-            lines.append(f"<b>{platform['name']}:</b>")
-
-            # Excluded characters
-            if platform["excluded_chars"]:
-                excluded_list = sorted(platform["excluded_chars"])
-                excluded_display = " ".join(
-                    f"<code>{c}</code>" if c != " " else "<code>space</code>"
-                    for c in excluded_list
-                )
-                lines.append(f"  • <b>Excluded characters:</b> {excluded_display}")
-
-            # Problematic characters
-            if platform["problematic_chars"]:
-                problematic_list = sorted(platform["problematic_chars"])
-                problematic_display = " ".join(
-                    f"<code>{c}</code>" for c in problematic_list
-                )
-                lines.append(
-                    f"  • <b>Problematic characters:</b> {problematic_display}"
-                )
-
-            # Position restrictions
-            position_descriptions = {
-                "trailing_space": "Trailing space",
-                "trailing_period": "Trailing period",
-                "leading_space": "Leading space",
-                "leading_period": "Leading period",
-            }
-            if platform["excluded_positions"]:
-                positions = [
-                    position_descriptions.get(p, p)
-                    for p in platform["excluded_positions"]
-                ]
-                lines.append(
-                    f"  • <b>Position restrictions:</b> {', '.join(positions)}"
-                )
-
-            # Reserved names
-            if platform.get("reserved_names"):
-                reserved_list = sorted(platform["reserved_names"])
-                reserved_display = ", ".join(
-                    f"<code>{name}</code>" for name in reserved_list[:10]
-                )  # Show first 10
-                if len(reserved_list) > 10:
-                    reserved_display += f" <i>(and {len(reserved_list) - 10} more)</i>"
-                lines.append(f"  • <b>Reserved names:</b> {reserved_display}")
-
-            # Length restrictions
-            length_info = []
-            if platform.get("max_filename_length"):
-                length_info.append(
-                    f"Max filename: {platform['max_filename_length']} characters"
-                )
-            if platform.get("max_path_length"):
-                length_info.append(
-                    f"Max path: {platform['max_path_length']} characters"
-                )
-            if length_info:
-                lines.append(
-                    f"  • <b>Length restrictions:</b> {', '.join(length_info)}"
-                )
-
-            # Additional restrictions
-            if platform.get("additional_restrictions"):
-                addl_desc = {
-                    "no_space_period_after_ext": "Cannot end with space/period before extension",
-                    "no_spaces_only": "Cannot consist solely of spaces",
-                }
-                addl_list = [
-                    addl_desc.get(r, r) for r in platform["additional_restrictions"]
-                ]
-                lines.append(
-                    f"  • <b>Additional restrictions:</b> {', '.join(addl_list)}"
-                )
-
-            lines.append(f"  • <i>{platform['description']}</i>")
-            lines.append("")
-
-        return "<br>".join(lines)
+        # The selected_platforms dict already has most recent first
+        if platforms is self.selected_platforms:
+            # The usual caller: already in display order, nothing to filter
+            key = tuple(platforms)
+        else:
+            # Filter to only show platforms that are currently selected
+            display_order = [p for p in self.selected_platforms if p in platforms]
+            # Platforms given but not selected go in front, last one first; a dict
+            # lookup each instead of searching display_order
+            missing = [p for p in platforms if p not in self.selected_platforms]
+            key = tuple(missing[::-1] + display_order)
+
+        info = self._info_cache.get(key)
+        if info is None:
+            info = "<br>".join(_SECTION_HTML[platform_key] for platform_key in key)
+            self._info_cache[key] = info
+        return info
 
     def on_platform_button_hover(self, platform_key):
         """Show platform restrictions on hover"""
-        platform = PLATFORM_RESTRICTIONS[platform_key]
-        info = f"<b>{platform['name']}:</b><br><br>"
-
-        if platform["excluded_chars"]:
-            excluded_list = sorted(platform["excluded_chars"])
-            excluded_display = " ".join(
-                f"<code>{c}</code>" if c != " " else "<code>space</code>"
-                for c in excluded_list
-            )
-            info += f"<b>Excluded characters:</b> {excluded_display}<br>"
-
-        if platform["problematic_chars"]:
-            problematic_list = sorted(platform["problematic_chars"])
-            problematic_display = " ".join(
-                f"<code>{c}</code>" for c in problematic_list
-            )
-            info += f"<b>Problematic characters:</b> {problematic_display}<br>"
-
-        position_descriptions = {
-            "trailing_space": "Trailing space",
-            "trailing_period": "Trailing period",
-            "leading_space": "Leading space",
-            "leading_period": "Leading period",
-        }
-        if platform["excluded_positions"]:
-            positions = [
-                position_descriptions.get(p, p) for p in platform["excluded_positions"]
-            ]
-            info += f"<b>Position restrictions:</b> {', '.join(positions)}<br>"
-
-        # Reserved names
-        if platform.get("reserved_names"):
-            reserved_list = sorted(platform["reserved_names"])
-            reserved_display = ", ".join(
-                f"<code>{name}</code>" for name in reserved_list[:10]
-            )
-            if len(reserved_list) > 10:
-                reserved_display += f" <i>(and {len(reserved_list) - 10} more)</i>"
-            info += f"<b>Reserved names:</b> {reserved_display}<br>"
-
-        # Length restrictions
-        length_info = []
-        if platform.get("max_filename_length"):
-            length_info.append(
-                f"Max filename: {platform['max_filename_length']} characters"
-            )
-        if platform.get("max_path_length"):
-            length_info.append(f"Max path: {platform['max_path_length']} characters")
-        if length_info:
-            info += f"<b>Length restrictions:</b> {', '.join(length_info)}<br>"
-
-        # Additional restrictions
-        if platform.get("additional_restrictions"):
-            addl_desc = {
-                "no_space_period_after_ext": "Cannot end with space/period before extension",
-                "no_spaces_only": "Cannot consist solely of spaces",
-            }
-            addl_list = [
-                addl_desc.get(r, r) for r in platform["additional_restrictions"]
-            ]
-            info += f"<b>Additional restrictions:</b> {', '.join(addl_list)}<br>"
-
-        info += f"<br><i>{platform['description']}</i>"
-        self.compatibility_info_label.setText(info)
+        self.compatibility_info_label.setText(_HOVER_HTML[platform_key])
 
     def on_platform_button_leave(self):
         """Clear hover info or show selected platforms"""
@@ -1698,53 +2131,100 @@ class NameDropApp(QMainWindow):
                 "Hover over a platform button to see restrictions, or click to apply filters."
             )
 
+    @Slot(bool)
+    def _on_platform_clicked(self, checked):
+        """Route a platform button's clicked signal to on_platform_button_clicked"""
+        self.on_platform_button_clicked(self.sender().platform_key, checked)
+
     def on_platform_button_clicked(self, platform_key, checked):
         """Handle platform button click"""
         if platform_key == "Everything":
             # "Everything" checks all other buttons
             if checked:
                 # Check all other platform buttons
-                for key in self.platform_buttons:
-                    if key != "Everything":
-                        self.platform_buttons[key].setChecked(True)
-                self.selected_platforms = set(self.platform_buttons.keys())
-                # Update selection order - "Everything" first, then others
-                self.platform_selection_order = ["Everything"] + [
-                    k for k in self.platform_buttons.keys() if k != "Everything"
-                ]
+                self._set_platform_buttons_checked(_SPECIFIC_PLATFORM_KEYS, True)
+                # Select all - "Everything" first, then others
+                self.selected_platforms = OrderedDict.fromkeys(_PLATFORM_KEYS)
             else:
                 # Uncheck all buttons
-                for btn in self.platform_buttons.values():
-                    btn.setChecked(False)
-                self.selected_platforms = set()
-                self.platform_selection_order = []
+                self._set_platform_buttons_checked(self.platform_buttons, False)
+                self.selected_platforms.clear()
         else:
             # Uncheck "Everything" if selecting specific platforms
             if checked:
                 self.platform_buttons["Everything"].setChecked(False)
-                if "Everything" in self.selected_platforms:
-                    self.selected_platforms.remove("Everything")
-                    # Remove "Everything" from selection order
-                    if "Everything" in self.platform_selection_order:
-                        self.platform_selection_order.remove("Everything")
-                self.selected_platforms.add(platform_key)
+                self.selected_platforms.pop("Everything", None)
                 # Add to front of selection order (most recent first)
-                if platform_key in self.platform_selection_order:
-                    self.platform_selection_order.remove(platform_key)
-                self.platform_selection_order.insert(0, platform_key)
+                self.selected_platforms[platform_key] = None
+                self.selected_platforms.move_to_end(platform_key, last=False)
             else:
-                self.selected_platforms.discard(platform_key)
-                # Remove from selection order
-                if platform_key in self.platform_selection_order:
-                    self.platform_selection_order.remove(platform_key)
+                self.selected_platforms.pop(platform_key, None)
                 # If all specific platforms are unchecked, uncheck "Everything" too
                 if not self.selected_platforms:
                     self.platform_buttons["Everything"].setChecked(False)
-                    self.platform_selection_order = []
 
+        self.invalidate_translate_table()
+        self._schedule_filter()
+
+    def _set_platform_buttons_checked(self, keys, checked):
+        """
+        Set the checked state of several platform buttons with their signals blocked
+        The caller updates the selection itself, once for the whole batch
+        """
+        for key in keys:
+            btn = self.platform_buttons[key]
+            btn.blockSignals(True)
+            btn.setChecked(checked)
+            btn.blockSignals(False)
+
+    def _schedule_filter(self):
+        """
+        Refresh the compatibility info and filter once control returns to the event
+        loop, so a burst of platform changes costs a single redraw
+        """
+        if not self._filter_dirty:
+            self._filter_dirty = True
+            QTimer.singleShot(0, self._flush_filter)
+
+    def _flush_filter(self):
+        """Run the refresh queued by _schedule_filter"""
+        self._filter_dirty = False
         self.update_compatibility_info()
         self.apply_compatibility_filter()
 
+    def invalidate_translate_table(self):
+        """Drop the cached compatibility filter table so it is rebuilt on next use"""
+        self._translate_table = None
+        self._filter_pipeline = None
+        self._active_restrictions = None
+
+    def get_translate_table(self, restrictions, ignore_chars):
+        """
+        Get the str.translate table that deletes the excluded and problematic
+        characters of the selected platforms, except spaces and ignored characters
+        """
+        if self._translate_table is None:
+            removable_chars = restrictions["removable_chars"]
+            if removable_chars.isdisjoint(ignore_chars):
+                # Precomputed along with the combined restrictions
+                self._translate_table = restrictions["translate_table"]
+            else:
+                self._translate_table = str.maketrans(
+                    "", "", "".join(removable_chars - ignore_chars)
+                )
+        return self._translate_table
+
+    def get_filter_pipeline(self, restrictions, ignore_chars):
+        """
+        Get the function applying the compatibility filter for the selected platforms
+        and ignored characters to a name
+        """
+        if self._filter_pipeline is None:
+            self._filter_pipeline = _compile_filter(
+                restrictions, self.get_translate_table(restrictions, ignore_chars)
+            )
+        return self._filter_pipeline
+
     def update_compatibility_info(self):
         """Update the compatibility info display"""
         if self.selected_platforms:
@@ -1765,97 +2245,58 @@ class NameDropApp(QMainWindow):
         if not self.selected_platforms:
             self.compatibility_filtered_name = None
             self.rename_btn.setEnabled(False)
+            self._last_filter_sig = None
             if self.current_file_name:
                 # Show original filename
                 ignore_chars = self.get_ignore_chars()
-                bad_chars = self.char_utils.find_non_standard_ascii(
-                    self.current_file_name, ignore_chars
-                )
+                bad_chars = self.get_analyzer()(self.current_file_name)
                 self.file_name_display.set_file_name(
                     self.current_file_name, bad_chars, ignore_chars
                 )
             return
 
-        restrictions = self.get_combined_restrictions(self.selected_platforms)
-        ignore_chars = self.get_ignore_chars()  # Get characters to ignore
-        filtered_name = self.current_file_name
-
-        # Remove excluded characters (spaces are NOT excluded - they're allowed in filenames)
-        # Only remove leading/trailing spaces based on position restrictions
-        # Don't remove characters that are in the ignore_chars list
-        for char in restrictions["excluded_chars"]:
-            # Never remove spaces - they're allowed characters, only position matters
-            # Never remove characters that are in the ignore list
-            if char != " " and char not in ignore_chars:
-                filtered_name = filtered_name.replace(char, "")
-
-        # Remove problematic characters (spaces are NOT problematic)
-        # Don't remove characters that are in the ignore_chars list
-        for char in restrictions["problematic_chars"]:
-            # Never remove spaces - they're allowed characters
-            # Never remove characters that are in the ignore list
-            if char != " " and char not in ignore_chars:
-                filtered_name = filtered_name.replace(char, "")
+        restrictions = self.get_active_restrictions()
+        ignore_chars = self.get_ignore_chars()  # Get characters to ignore (frozen)
+        file_name = self.current_file_name
+
+        # Selecting a platform whose restrictions are already covered leaves the
+        # result unchanged, so there is nothing to redo
+        sig = (
+            file_name,
+            restrictions["removable_chars"],
+            restrictions["excluded_positions"],
+            ignore_chars,
+        )
+        if sig == self._last_filter_sig:
+            return
 
-        # Handle position restrictions - only remove spaces at specific positions
-        if "trailing_space" in restrictions["excluded_positions"]:
-            filtered_name = filtered_name.rstrip(" ")
-        if "trailing_period" in restrictions["excluded_positions"]:
-            # Remove trailing periods but keep the one before extension (if it exists)
-            # Split filename and extension
-            if "." in filtered_name:
-                name_part, ext_part = filtered_name.rsplit(".", 1)
-                # Remove trailing periods from name part only
-                name_part = name_part.rstrip(".")
-                filtered_name = (
-                    name_part + "." + ext_part
-                    if name_part or ext_part
-                    else filtered_name.rstrip(".")
-                )
-            else:
-                # No extension, remove all trailing periods
-                filtered_name = filtered_name.rstrip(".")
-        if "leading_space" in restrictions["excluded_positions"]:
-            filtered_name = filtered_name.lstrip(" ")
-        if "leading_period" in restrictions["excluded_positions"]:
-            filtered_name = filtered_name.lstrip(".")
+        if self._post_rename_hint == file_name:
+            # Just renamed to the filter's own output, which filtering leaves as is
+            filtered_name = file_name
+        else:
+            # Spaces are never removed - they're allowed characters, only position
+            # matters. Characters in the ignore_chars list are never removed either
+            filtered_name = self.get_filter_pipeline(restrictions, ignore_chars)(
+                file_name
+            )
 
         self.compatibility_filtered_name = filtered_name
 
         # Update display with filtered name
-        ignore_chars = self.get_ignore_chars()  # Get ignore chars once
-
-        if filtered_name != self.current_file_name:
-            # Show what was removed
-            # Find characters that were removed
-            removed_chars = set()
-            for char in self.current_file_name:
-                if char not in filtered_name:
-                    removed_chars.add(char)
-
-            # Show filtered name with removed characters highlighted
-            bad_chars = self.char_utils.find_non_standard_ascii(
-                filtered_name, ignore_chars
-            )
-            bad_chars.update(
-                removed_chars
-            )  # Also highlight removed chars if they appear in original
-            # Remove ignore_chars from bad_chars to ensure they're never highlighted
-            bad_chars = bad_chars - ignore_chars
-            self.file_name_display.set_file_name(filtered_name, bad_chars, ignore_chars)
-            self.rename_btn.setEnabled(True)
-        else:
-            # No changes needed
-            bad_chars = self.char_utils.find_non_standard_ascii(
-                filtered_name, ignore_chars
-            )
-            # Remove ignore_chars from bad_chars to ensure they're never highlighted
-            bad_chars = bad_chars - ignore_chars
-            self.file_name_display.set_file_name(filtered_name, bad_chars, ignore_chars)
-            self.rename_btn.setEnabled(False)
+        bad_chars = self.get_analyzer()(filtered_name)
+        changed = filtered_name != file_name
+        if changed:
+            # Also highlight characters that were removed from the original
+            bad_chars |= set(file_name).difference(filtered_name)
+            # Position strips can remove ignored characters (spaces, periods); make
+            # sure ignore_chars are never highlighted
+            bad_chars -= ignore_chars
+        self.file_name_display.set_file_name(filtered_name, bad_chars, ignore_chars)
+        self.rename_btn.setEnabled(changed)
 
         # Update LED indicators with filtered name
         self.update_platform_leds(filtered_name)
+        self._last_filter_sig = sig
 
     def update_platform_leds(self, file_name: str = None):
         """Update LED indicators based on filename compatibility with each platform"""
@@ -1874,6 +2315,30 @@ class NameDropApp(QMainWindow):
 
         ignore_chars = self.get_ignore_chars()
 
+        # Per-name work shared by every platform, done once: the name's characters
+        # (minus ignored ones), its non-standard ASCII, and its uppercased stem
+        name_chars = set(file_name).difference(ignore_chars)
+        bad_chars = self.get_analyzer()(file_name)
+        name_part, dot, _ = file_name.rpartition(".")
+        if not dot:
+            name_part = file_name
+        upper_stem = name_part.upper()
+        name_length = len(file_name)
+        # Which excluded_positions / additional_restrictions entries the name breaks
+        position_hits = {
+            "trailing_space": file_name.endswith(" "),
+            # Trailing periods (but not the extension separator)
+            "trailing_period": file_name.endswith(".") or name_part.endswith("."),
+            "leading_space": file_name.startswith(" "),
+            "leading_period": file_name.startswith("."),
+        }
+        additional_hits = {
+            # Filename cannot end with a space or period followed by an extension
+            "no_space_period_after_ext": bool(dot) and name_part.endswith((" ", ".")),
+            # Filename cannot consist solely of spaces
+            "no_spaces_only": file_name.isspace(),
+        }
+
         # Check each platform
         for platform_key, led in self.platform_leds.items():
             platform = PLATFORM_RESTRICTIONS.get(platform_key)
@@ -1881,79 +2346,39 @@ class NameDropApp(QMainWindow):
                 led.set_color("gray")
                 continue
 
-            # Check for invalid/excluded characters
-            excluded_chars = platform["excluded_chars"] - ignore_chars
-            problematic_chars = platform["problematic_chars"] - ignore_chars
-            excluded_positions = platform["excluded_positions"]
-            reserved_names = platform.get("reserved_names", set())
-            max_path_length = platform.get("max_path_length", None)
-            additional_restrictions = platform.get("additional_restrictions", [])
+            max_path_length = platform.max_path_length
 
-            has_excluded = any(char in file_name for char in excluded_chars)
-            has_problematic = any(char in file_name for char in problematic_chars)
-            has_position_issues = False
-            has_reserved_name = False
-            has_additional_restrictions = False
+            # Check for invalid/excluded characters (one C-level set test each)
+            has_excluded = not platform.excluded_chars.isdisjoint(name_chars)
+            has_problematic = not platform.problematic_chars.isdisjoint(name_chars)
 
             # Check reserved names (case-insensitive for Windows/Cloud)
-            if reserved_names:
-                # Get filename without extension for reserved name check
-                if "." in file_name:
-                    name_without_ext = file_name.rsplit(".", 1)[0].upper()
-                else:
-                    name_without_ext = file_name.upper()
-
-                # Check if name matches any reserved name (case-insensitive)
-                if name_without_ext in {name.upper() for name in reserved_names}:
-                    has_reserved_name = True
-
-            # Check position restrictions
-            if "trailing_space" in excluded_positions and file_name.endswith(" "):
-                has_position_issues = True
-            if "trailing_period" in excluded_positions:
-                # Check for trailing periods (but not the extension separator)
-                if "." in file_name:
-                    name_part = file_name.rsplit(".", 1)[0]
-                    if name_part.endswith(".") or file_name.endswith("."):
-                        has_position_issues = True
-                elif file_name.endswith("."):
-                    has_position_issues = True
-            if "leading_space" in excluded_positions and file_name.startswith(" "):
-                has_position_issues = True
-            if "leading_period" in excluded_positions and file_name.startswith("."):
-                has_position_issues = True
-
-            # Check additional restrictions
-            if "no_space_period_after_ext" in additional_restrictions:
-                # Filename cannot end with a space or period followed by an extension
-                if "." in file_name:
-                    name_part, ext_part = file_name.rsplit(".", 1)
-                    if name_part.endswith(" ") or name_part.endswith("."):
-                        has_additional_restrictions = True
-
-            if "no_spaces_only" in additional_restrictions:
-                # Filename cannot consist solely of spaces
-                if file_name.strip() == "" and file_name:
-                    has_additional_restrictions = True
+            # PlatformSpec stores reserved names uppercased, so the stem is compared
+            # directly
+            has_reserved_name = upper_stem in platform.reserved_names
+
+            # Check position and additional restrictions against the name's hits
+            has_position_issues = any(
+                position_hits.get(position, False)
+                for position in platform.excluded_positions
+            )
+            has_additional_restrictions = any(
+                additional_hits.get(restriction, False)
+                for restriction in platform.additional_restrictions
+            )
 
             # Check filename length restrictions
-            max_filename_length = platform.get("max_filename_length", None)
-            if max_filename_length and len(file_name) > max_filename_length:
+            max_filename_length = platform.max_filename_length
+            if max_filename_length and name_length > max_filename_length:
                 has_additional_restrictions = True
 
             # Check path length (for full path, we'd need the parent path, but for filename we check if it's reasonable)
             # Note: This is a simplified check - full path length would require parent directory
             if (
-                max_path_length and len(file_name) > max_path_length - 50
+                max_path_length and name_length > max_path_length - 50
             ):  # Leave room for path
                 has_additional_restrictions = True
 
-            # Check for non-standard ASCII (excluding ignore_chars)
-            bad_chars = (
-                self.char_utils.find_non_standard_ascii(file_name, ignore_chars)
-                - ignore_chars
-            )
-
             # Determine LED color based on priority: Red > Purple > Orange > Yellow > Green
             # Purple includes: position issues, reserved names, additional restrictions
             if has_excluded:
@@ -1973,27 +2398,13 @@ class NameDropApp(QMainWindow):
 
     def generate_random_filename(self):
         """Generate a random filename with various problematic characters for testing"""
-        # Characters to include in random filename
-        excluded_chars = list('<>:"|?*\\/')
-        problematic_chars = list("!@#$%^&()[]{};,=+")
-        non_ascii_chars = [
-            "é",
-            "ñ",
-            "ü",
-            "à",
-            "ç",
-            "ö",
-            "ä",
-            "ß",
-            "ø",
-            "å",
-            "æ",
-            "œ",
-            "€",
-            "£",
-            "¥",
-        ]
-        safe_chars = list(string.ascii_letters + string.digits + "._- ")
+        # The three runs of safe characters come from one draw, sliced up below
+        first, second, third = (
+            random.randint(3, 8),
+            random.randint(2, 6),
+            random.randint(2, 5),
+        )
+        safe = "".join(random.choices(_RANDOM_SAFE_CHARS, k=first + second + third))
 
         # Build random filename parts
         parts = []
@@ -2003,31 +2414,33 @@ class NameDropApp(QMainWindow):
             parts.append(" " if random.random() < 0.5 else ".")
 
         # Add some safe characters
-        parts.append("".join(random.choices(safe_chars, k=random.randint(3, 8))))
+        parts.append(safe[:first])
 
         # Add some excluded characters
         if random.random() < 0.7:
             parts.append(
-                "".join(random.choices(excluded_chars, k=random.randint(1, 3)))
+                "".join(random.choices(_RANDOM_EXCLUDED_CHARS, k=random.randint(1, 3)))
             )
 
         # Add more safe characters
-        parts.append("".join(random.choices(safe_chars, k=random.randint(2, 6))))
+        parts.append(safe[first : first + second])
 
         # Add problematic characters
         if random.random() < 0.6:
             parts.append(
-                "".join(random.choices(problematic_chars, k=random.randint(1, 3)))
+                "".join(
+                    random.choices(_RANDOM_PROBLEMATIC_CHARS, k=random.randint(1, 3))
+                )
             )
 
         # Add non-ASCII characters
         if random.random() < 0.5:
             parts.append(
-                "".join(random.choices(non_ascii_chars, k=random.randint(1, 3)))
+                "".join(random.choices(_RANDOM_NON_ASCII_CHARS, k=random.randint(1, 3)))
             )
 
         # Add more safe characters
-        parts.append("".join(random.choices(safe_chars, k=random.randint(2, 5))))
+        parts.append(safe[first + second :])
 
         # Sometimes add trailing space or period
         if random.random() < 0.2:
@@ -2038,8 +2451,7 @@ class NameDropApp(QMainWindow):
 
         # Sometimes add an extension
         if random.random() < 0.7:
-            extensions = ["txt", "pdf", "doc", "jpg", "png", "mp3", "zip"]
-            random_name += "." + random.choice(extensions)
+            random_name += "." + random.choice(_RANDOM_EXTENSIONS)
 
         # Sometimes make it too long
         if random.random() < 0.3:
@@ -2049,29 +2461,16 @@ class NameDropApp(QMainWindow):
 
         # Update the display with the random filename
         ignore_chars = self.get_ignore_chars()
-        bad_chars = (
-            self.char_utils.find_non_standard_ascii(random_name, ignore_chars)
-            - ignore_chars
-        )
+        bad_chars = find_non_standard_ascii(random_name, ignore_chars)
 
         # Also add all excluded and problematic characters that appear in the random filename
         # This ensures all problematic characters are highlighted, not just non-standard ASCII
-        all_excluded_chars = set('<>:"|?*\\/')
-        all_problematic_chars = set("!@#$%^&()[]{};,=+")
-
-        # Find which excluded/problematic chars are actually in the random_name
-        for char in random_name:
-            if char in all_excluded_chars or char in all_problematic_chars:
-                bad_chars.add(char)
+        bad_chars |= _RANDOM_HIGHLIGHT_CHARS.intersection(random_name)
 
         # Remove ignore_chars from bad_chars
         bad_chars = bad_chars - ignore_chars
 
-        # Add length restriction highlighting if platforms are selected
-        if self.selected_platforms:
-            length_bad_chars = self.get_length_restriction_chars(random_name)
-            bad_chars = bad_chars | length_bad_chars
-
+        # set_file_name adds the length restriction highlighting itself
         self.file_name_display.set_file_name(random_name, bad_chars, ignore_chars)
 
         # Update LED indicators
@@ -2086,6 +2485,8 @@ class NameDropApp(QMainWindow):
 
     def on_filename_edited(self, new_text: str):
         """Handle when user edits the filename in the display"""
+        # The display no longer shows the filter's output
+        self._last_filter_sig = None
         # Update the rename button state based on whether text has changed
         if new_text != self.current_file_name:
             self.rename_btn.setEnabled(True)
@@ -2108,7 +2509,8 @@ class NameDropApp(QMainWindow):
         if not self.current_file_path:
             return
 
-        # Get the current text from the display
+        # Get the current text from the display, with any pending edit handled
+        self.file_name_display.flush_pending_edit()
         new_name = self.file_name_display.get_text()
 
         if not new_name or new_name == self.current_file_name:
@@ -2121,26 +2523,29 @@ class NameDropApp(QMainWindow):
                         "No Changes",
                         "The filename is already compatible with the selected platforms.",
                     )
+                    self._advance_if_queued("No changes needed")
                     return
             else:
                 QMessageBox.information(
                     self, "No Changes", "The filename hasn't been changed."
                 )
+                self._advance_if_queued("No changes made")
                 return
 
         # Show preview if prompting is enabled
         if self.prompt_check.isChecked():
-            dialog = RenamePreviewDialog(self.current_file_name, new_name, self)
+            dialog = self.get_rename_preview(self.current_file_name, new_name)
             if dialog.exec() != QDialog.Accepted:
                 return
 
         # Determine the operation description
-        if new_name == self.compatibility_filtered_name:
+        prefiltered = new_name == self.compatibility_filtered_name
+        if prefiltered:
             operation = "Platform compatibility filter"
         else:
             operation = "Manual edit"
 
-        self.perform_rename(new_name, operation)
+        self.perform_rename(new_name, operation, prefiltered=prefiltered)
 
     def rename_with_compatibility_filter(self):
         """Perform rename using the compatibility filtered name (legacy method)"""
@@ -2157,34 +2562,57 @@ class NameDropApp(QMainWindow):
 
         # Show preview if prompting is enabled
         if self.prompt_check.isChecked():
-            dialog = RenamePreviewDialog(
-                self.current_file_name, self.compatibility_filtered_name, self
+            dialog = self.get_rename_preview(
+                self.current_file_name, self.compatibility_filtered_name
             )
             if dialog.exec() != QDialog.Accepted:
                 return
 
         self.perform_rename(
-            self.compatibility_filtered_name, "Platform compatibility filter"
+            self.compatibility_filtered_name,
+            "Platform compatibility filter",
+            prefiltered=True,
         )
 
+    def get_rename_preview(self, old_name: str, new_name: str):
+        """Get the rename preview dialog, created once and reused for every rename"""
+        if self._preview_dialog is None:
+            self._preview_dialog = RenamePreviewDialog(old_name, new_name, self)
+        else:
+            self._preview_dialog.set_names(old_name, new_name)
+        return self._preview_dialog
+
     def check_leading_trailing_issues(self, file_name: str):
         """Check for leading/trailing spaces and periods, return list of issues"""
+        # Clean names (the usual case) are settled by two C-level tuple checks;
+        # "." and ".." start with a period, so they never take this exit
+        if not file_name.startswith(_EDGE_CHARS) and not file_name.endswith(
+            _EDGE_CHARS
+        ):
+            return []
         issues = []
-        if file_name.startswith(" "):
-            issues.append("Filename starts with a space")
-        if file_name.endswith(" "):
-            issues.append("Filename ends with a space")
-        if file_name.startswith("."):
-            issues.append("Filename starts with a period")
-        if file_name.endswith("."):
-            issues.append("Filename ends with a period")
+        # Slices, so an empty name needs no special case
+        first, last = file_name[:1], file_name[-1:]
+        if first in _EDGE_CHAR_NAMES:
+            issues.append(f"Filename starts with a {_EDGE_CHAR_NAMES[first]}")
+        if last in _EDGE_CHAR_NAMES:
+            issues.append(f"Filename ends with a {_EDGE_CHAR_NAMES[last]}")
         # Check for reserved directory names
         if file_name == "." or file_name == "..":
             issues.append(f"Filename '{file_name}' is a reserved directory name")
         return issues
 
-    def perform_rename(self, new_name: str, operation_description: str):
-        """Perform the actual rename operation"""
+    def perform_rename(
+        self, new_name: str, operation_description: str, prefiltered: bool = False
+    ):
+        """
+        Perform the actual rename operation
+        prefiltered means new_name is the compatibility filter's output for the
+        current selection, so the refresh afterwards need not filter it again
+        """
+        filter_output = new_name if prefiltered else None
+        # Taken up front, so no early return below can leave it set
+        vacant_path, self._vacant_path = self._vacant_path, None
         if not self.current_file_path or not new_name:
             return False
 
@@ -2212,12 +2640,18 @@ class NameDropApp(QMainWindow):
             QMessageBox.warning(self, "Invalid Name", "File name cannot be empty.")
             return False
 
-        old_path = Path(self.current_file_path)
-        parent_dir = old_path.parent
-        new_path = parent_dir / new_name
-
-        # Check if new name already exists
-        if new_path.exists() and new_path != old_path:
+        # Plain strings: nothing below needs Path objects except the backup copy
+        old_path = self.current_file_path
+        parent_dir, old_name = os.path.split(old_path)
+        new_path = os.path.join(parent_dir, new_name)
+
+        # Check if new name already exists, unless edit_name just did
+        # (rename_file still refuses to overwrite if that has changed since)
+        if (
+            new_path != old_path
+            and new_path != vacant_path
+            and self._target_exists(parent_dir, new_name)
+        ):
             QMessageBox.warning(
                 self,
                 "Rename Failed",
@@ -2226,7 +2660,7 @@ class NameDropApp(QMainWindow):
             return False
 
         # Validate filename
-        if not self.file_ops.is_valid_filename(new_name):
+        if not is_valid_filename(new_name):
             QMessageBox.warning(
                 self,
                 "Invalid Name",
@@ -2236,22 +2670,32 @@ class NameDropApp(QMainWindow):
 
         # Create backup if requested
         if self.backup_check.isChecked():
-            backup_path = parent_dir / f"BACKUP of {old_path.name}"
-            if not self.file_ops.create_backup(old_path, backup_path):
+            backup_path = os.path.join(parent_dir, f"BACKUP of {old_name}")
+            # The backup adds an entry (maybe with a number suffix) to the folder
+            self._dir_cache.pop(parent_dir, None)
+            if not create_backup(Path(old_path), Path(backup_path)):
                 QMessageBox.warning(
                     self, "Backup Failed", "Could not create backup. Rename cancelled."
                 )
                 return False
 
         # Perform rename
-        if self.file_ops.rename_file(old_path, new_path):
-            self.current_file_path = str(new_path)
+        if rename_file(old_path, new_path):
+            self._note_rename(parent_dir, old_name, new_name)
+            self.current_file_path = new_path
             self.current_file_name = new_name
-            self.status_label.setText(f"Successfully renamed: {operation_description}")
-            self.status_label.setStyleSheet(
-                "padding: 5px; background-color: #e8f5e9; color: #2e7d32;"
-            )
-            self.on_file_selected()  # Refresh display
+            status = f"Successfully renamed: {operation_description}"
+            self.status_label.setText(status)
+            self.set_status_style("success")
+            # A name the issue dialog left alone is still the filter's output
+            if new_name == filter_output:
+                self._post_rename_hint = new_name
+            if self._pending_files:
+                # Batch drop: continue with the next file, keeping the message
+                self._advance(status)
+            else:
+                self.on_file_selected()  # Refresh display
+            self._post_rename_hint = None
             return True
         else:
             QMessageBox.critical(
@@ -2261,107 +2705,119 @@ class NameDropApp(QMainWindow):
             )
             return False
 
+    def _target_exists(self, parent_dir: str, name: str) -> bool:
+        """
+        Check whether parent_dir already has an entry called name
+        Each folder is listed once and the listing kept, so a batch of renames in one
+        folder costs a single listing instead of a stat per rename
+        """
+        entries = self._dir_cache.get(parent_dir)
+        if entries is None:
+            try:
+                names = os.listdir(parent_dir or ".")
+            except OSError:
+                return os.path.exists(os.path.join(parent_dir, name))
+            entries = (set(names), {entry.casefold() for entry in names})
+            self._dir_cache[parent_dir] = entries
+        exact, folded = entries
+        if name in exact:
+            return True
+        if name.casefold() in folded:
+            # Differs from an entry only by case, which collides only on
+            # case-insensitive file systems: let the file system decide
+            return os.path.exists(os.path.join(parent_dir, name))
+        return False
+
+    def _note_rename(self, parent_dir: str, old_name: str, new_name: str):
+        """Keep a cached folder listing in step with a rename done by this app"""
+        entries = self._dir_cache.get(parent_dir)
+        if entries is not None:
+            exact, folded = entries
+            exact.discard(old_name)
+            exact.add(new_name)
+            # The old casefolded name is left behind; a stale entry only costs a
+            # fallback stat in _target_exists
+            folded.add(new_name.casefold())
+
     def auto_rename(self):
         """Auto rename: replace accented chars and remove other bad chars"""
-        if not self.current_file_path:
-            return
-
-        ignore_chars = self.get_ignore_chars()
-        new_name = self.char_utils.auto_fix_name(self.current_file_name, ignore_chars)
-
-        if new_name == self.current_file_name:
-            QMessageBox.information(
-                self, "No Changes Needed", "The file name is already clean."
-            )
-            return
-
-        # Show preview if prompting is enabled
-        if self.prompt_check.isChecked():
-            dialog = RenamePreviewDialog(self.current_file_name, new_name, self)
-            if dialog.exec() != QDialog.Accepted:
-                return
-
-        self.perform_rename(new_name, "Auto Rename")
+        self._rename_cleaned(auto_fix_name, "Auto Rename")
 
     def remove_bad_chars(self):
         """Remove all bad characters from name"""
-        if not self.current_file_path:
-            return
-
-        ignore_chars = self.get_ignore_chars()
-        new_name = self.char_utils.remove_bad_chars(
-            self.current_file_name, ignore_chars
-        )
-
-        if new_name == self.current_file_name:
-            QMessageBox.information(
-                self, "No Changes Needed", "The file name is already clean."
-            )
-            return
-
-        # Show preview if prompting is enabled
-        if self.prompt_check.isChecked():
-            dialog = RenamePreviewDialog(self.current_file_name, new_name, self)
-            if dialog.exec() != QDialog.Accepted:
-                return
-
-        self.perform_rename(new_name, "Remove bad characters")
+        self._rename_cleaned(remove_bad_chars, "Remove bad characters")
 
     def replace_bad_chars(self):
         """Replace only accented characters with unaccented equivalents"""
+        self._rename_cleaned(replace_accented_chars, "Replace bad characters")
+
+    def _rename_cleaned(self, fix, operation):
+        """Rename the current file to fix(name), shared by the three clean buttons"""
         if not self.current_file_path:
             return
 
-        ignore_chars = self.get_ignore_chars()
-        new_name = self.char_utils.replace_accented_chars(
-            self.current_file_name, ignore_chars
-        )
+        name = self.current_file_name
+        if is_all_standard_ascii(name):
+            # Printable ASCII is already clean for all three fixes
+            new_name = name
+        else:
+            new_name = _cleaned_name(fix, name, self.get_ignore_chars())
 
         if new_name == self.current_file_name:
-            QMessageBox.information(
-                self, "No Changes Needed", "The file name is already clean."
+            # Reported in the status label rather than a modal box, so repeated
+            # clicks on a clean name don't each open and close a dialog
+            self.status_label.setText(
+                "No changes needed - the file name is already clean"
             )
+            self.set_status_style("ok")
+            self._advance_if_queued("No changes needed")
             return
 
         # Show preview if prompting is enabled
         if self.prompt_check.isChecked():
-            dialog = RenamePreviewDialog(self.current_file_name, new_name, self)
+            dialog = self.get_rename_preview(self.current_file_name, new_name)
             if dialog.exec() != QDialog.Accepted:
                 return
 
-        self.perform_rename(new_name, "Replace bad characters")
+        self.perform_rename(new_name, operation)
 
     def edit_name(self):
         """Allow user to manually edit the file name"""
         if not self.current_file_path:
             return
 
-        # Create dialog for editing
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Edit File Name")
-        layout = QVBoxLayout()
-
-        layout.addWidget(QLabel("Edit file name:"))
-        edit_field = QLineEdit(self.current_file_name)
+        # Create dialog for editing (once; later calls only reset the text)
+        if self._edit_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Edit File Name")
+            layout = QVBoxLayout()
+
+            layout.addWidget(QLabel("Edit file name:"))
+            self._edit_field = QLineEdit()
+            layout.addWidget(self._edit_field)
+
+            buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            layout.addWidget(buttons)
+
+            dialog.setLayout(layout)
+            self._edit_dialog = dialog
+        dialog = self._edit_dialog
+        edit_field = self._edit_field
+        edit_field.setText(self.current_file_name)
         edit_field.selectAll()
-        layout.addWidget(edit_field)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
-
-        dialog.setLayout(layout)
+        edit_field.setFocus()
 
         if dialog.exec() == QDialog.Accepted:
             new_name = edit_field.text().strip()
             if new_name and new_name != self.current_file_name:
                 # Validate new name doesn't exist
-                old_path = Path(self.current_file_path)
-                parent_dir = old_path.parent
-                new_path = parent_dir / new_name
+                old_path = self.current_file_path
+                parent_dir = os.path.dirname(old_path)
+                new_path = os.path.join(parent_dir, new_name)
 
-                if new_path.exists() and new_path != old_path:
+                if new_path != old_path and self._target_exists(parent_dir, new_name):
                     QMessageBox.warning(
                         self,
                         "Invalid Name",
@@ -2369,15 +2825,17 @@ class NameDropApp(QMainWindow):
                     )
                     return
 
-                if self.file_ops.is_valid_filename(new_name):
+                if is_valid_filename(new_name):
                     # Show preview if prompting is enabled
                     if self.prompt_check.isChecked():
-                        preview = RenamePreviewDialog(
-                            self.current_file_name, new_name, self
+                        preview = self.get_rename_preview(
+                            self.current_file_name, new_name
                         )
                         if preview.exec() != QDialog.Accepted:
                             return
 
+                    # perform_rename can skip repeating the existence check
+                    self._vacant_path = new_path
                     self.perform_rename(new_name, "Manual edit")
                 else:
                     QMessageBox.warning(
@@ -2392,7 +2850,6 @@ def main():
     app.setApplicationName("NameDrop")
 
     window = NameDropApp()
-    window.setWindowFlags(window.windowFlags() | Qt.WindowStaysOnTopHint)
     window.show()
 
     sys.exit(app.exec())
@@ -0,0 +1,35 @@
+"""
+Tests for rename grouping in file_operations
+
+Author: Rich Lewis
+GitHub: @RichLewis007
+"""
+
+from namedrop.file_operations import _dependent_groups
+
+
+def test_children_and_their_parent_share_one_group():
+    pairs = [
+        ("/t/D/a", "/t/D/a2"),
+        ("/t/D/b", "/t/D/b2"),
+        ("/t/D", "/t/E"),
+    ]
+    assert _dependent_groups(pairs) == [[0, 1, 2]]
+
+
+def test_parent_renamed_before_its_children():
+    pairs = [
+        ("/t/D", "/t/E"),
+        ("/t/D/a", "/t/D/a2"),
+        ("/t/D/b", "/t/D/b2"),
+    ]
+    assert _dependent_groups(pairs) == [[0, 1, 2]]
+
+
+def test_siblings_without_their_parent_stay_independent():
+    pairs = [
+        ("/t/D/a", "/t/D/a2"),
+        ("/t/D/b", "/t/D/b2"),
+        ("/t/X/c", "/t/X/d"),
+    ]
+    assert _dependent_groups(pairs) == [[0], [1], [2]]